@@ -7,73 +7,416 @@ Usage: python scripts/ingest_transcripts.py
 
 import os
 import re
+import asyncio
+import argparse
 import json
 import uuid
+import hashlib
+import functools
+import io
+import sqlite3
+import multiprocessing
+from array import array
+from bisect import bisect_right
+from collections import OrderedDict
 from pathlib import Path
-from typing import List, Dict, Optional, Tuple
+from typing import List, Dict, Optional, Tuple, Type
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from threading import Lock
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
 
-from openai import OpenAI
+from openai import AsyncOpenAI
+from openai.types.chat import ChatCompletion
+from pydantic import BaseModel, ValidationError
 from pinecone import Pinecone
 from pypdf import PdfReader
 
+# chat.completions.parse() left the beta namespace in openai 1.92
+OPENAI_MIN_VERSION = "1.92"
+
+try:
+    # Private openai helper that builds the strict JSON schema parse() sends; only
+    # --batch-api needs it, since batch request bodies must spell the schema out
+    from openai.lib._parsing import type_to_response_format_param
+except ImportError:
+    type_to_response_format_param = None
+
 # === Configuration ===
 PDF_FOLDER = Path("data/transcripts")  # Put your transcript PDFs here
 PINECONE_INDEX = os.getenv("PINECONE_INDEX_NAME", "ipcs")
 PINECONE_NAMESPACE = "transcripts"
-EMBED_MODEL = "text-embedding-3-large"
-EMBED_DIMENSION = 3072
-BATCH_SIZE = 50  # Pinecone batch size
+# The transcripts namespace shares the 3072-dim index (and query embeddings in
+# lib/pinecone.ts) with the other namespaces. A smaller model or a truncated
+# dimension (e.g. text-embedding-3-small/1536, or 3-large at 1024) needs a new
+# index and a matching query-side change.
+EMBED_MODEL = os.getenv("EMBED_MODEL", "text-embedding-3-large")
+EMBED_DIMENSION = int(os.getenv("EMBED_DIMENSION", "3072"))  # Sent as `dimensions` (Matryoshka truncation)
+CHAT_MODEL = "gpt-4o-mini"  # Cleaning, boundary detection and entity extraction
+BATCH_SIZE = 100  # Max vectors per Pinecone upsert request
+UPSERT_MAX_BYTES = 1_800_000  # Headroom under Pinecone's 2MB request limit
+EST_BYTES_PER_VALUE = 20  # Rough JSON size of one float in an upsert payload
+PINECONE_POOL_THREADS = 30  # Client-side threads for async_req upserts
+CACHE_DIR = Path("data/.cache")  # LLM extraction responses, keyed by content, model and prompt hash
+EMBED_BATCH_SIZE = 16  # Max inputs per embeddings request
+EMBED_BATCH_MAX_TOKENS = 250_000  # Stay under the per-request token cap
+API_MAX_CONCURRENCY = 32  # Max in-flight OpenAI requests (stays under the 3K RPM limit)
+MAX_PDF_WORKERS = 4  # PDFs processed in parallel
+PDF_SERIAL_MAX_PAGES = 8  # Up to this many pages: extract serially
+PDF_THREADED_MAX_PAGES = 500  # Up to this many pages: threads; beyond: processes
+MAX_PAGE_WORKERS = 8  # Workers used for page-level extraction
+PDF_READ_AHEAD = MAX_PDF_WORKERS + 2  # PDFs whose bytes may be held in memory awaiting extraction
+PDF_EXTRACTION_MODE = "layout"  # pypdf layout mode keeps glyph runs together as words
+
+# Chunk memoization. Cleaning works on fixed 5000-char windows and embedded chunks start
+# with their interview's Company/Interviewee header, so keys only repeat for duplicate
+# documents within a run, or across runs with --embedding-cache
+CLEAN_CACHE_SIZE = 4096  # Cleaned chunks kept in memory
+EMBED_CACHE_SIZE = 1024  # Embeddings kept in memory (~100KB each at 3072 dims)
+EMBEDDING_CACHE = False  # Also persist embeddings to SQLite across runs (--embedding-cache)
+EMBEDDING_STORE_PATH = CACHE_DIR / "embeddings.sqlite"
+
+# Transcript cleaning: regex normalization by default, gpt-4o-mini with --llm-clean
+LLM_CLEAN = False
+
+# OpenAI Batch API (--batch-api): ~50% cheaper, higher rate limits, up to 24h turnaround
+BATCH_API = False
+BATCH_COLLECT_SECONDS = 5  # Submit once no new LLM requests arrive for this long
+BATCH_POLL_SECONDS = 30  # How often to check a submitted batch's status
+HORIZONTAL_SPACE_RE = re.compile(r'[ \t\f\v]+')
+# Single letters joined by single spaces, e.g. "v i e w e r"; the wider gap between
+# letter-spaced words is their only separator, and digits ("Q 1 2 3") are left alone
+SPACED_LETTERS_RE = re.compile(r'\b(?:[^\W\d_] ){2,}[^\W\d_]\b')
+LINE_EDGE_SPACE_RE = re.compile(r' *\n *')
+EXCESS_NEWLINES_RE = re.compile(r'\n{3,}')
+
+# Chunk boundaries, found in one pass over the text
+PARAGRAPH_BREAK_RE = re.compile(r'\n\n')
+SENTENCE_BREAK_RE = re.compile(r'[.?!] ')
+SENTENCE_OR_LINE_BREAK_RE = re.compile(r'[.?!] |\n')
+
+# Interview splitting: header lines that start a new interview. "Round N" and
+# "Candidate:" headings also occur inside a single interview, so they don't count.
+INTERVIEW_HEADER_RE = re.compile(r'(?mi)^\s*(?:Company\s*[:\-]|Interview\s+with\b)')
+MIN_INTERVIEW_CHARS = 500  # Headers closer than this belong to the same interview
+LLM_SPLIT_MIN_CHARS = 50_000  # Only ask the LLM to split unusually long single-segment PDFs
+
+# === LLM prompts ===
+# Instructions live in constant system messages and only the variable text goes
+# at the end of the user message. At ~60-200 tokens these prefixes are below the
+# 1024-token minimum for OpenAI's prompt caching, so they are not cached today;
+# the layout only keeps caching possible if the instructions grow.
+CLEAN_SYSTEM_PROMPT = """You clean and normalize interview transcript text.
+
+Fix any spacing issues (e.g., "v i e w e r" should become "viewer"). Remove excessive whitespace. Preserve the conversation structure between Interviewer and Candidate.
+
+Return only the cleaned text, nothing else."""
+
+BOUNDARIES_SYSTEM_PROMPT = """You analyze PDF content to identify if it contains multiple separate interview transcripts.
+
+Look for patterns like:
+- New sections starting with "Company:", "Interview with:", "Candidate:", "Round", etc.
+- Clear separators between different interviews
+- Different company names or interviewee names appearing
+
+If there are multiple interviews, identify the approximate character positions where each interview starts and ends.
+
+Return JSON with:
+- "has_multiple_interviews": boolean
+- "interviews": array of objects with "start_char" and "end_char" positions (if multiple)
+
+If single interview, return has_multiple_interviews false and a single interview from 0 to the document length given by the user."""
+
+ENTITIES_SYSTEM_PROMPT = """You extract structured information from interview transcripts. Extract:
+
+1. Company Name: The name of the company conducting the interview (e.g., "KPMG", "BITSvertise", "Aditya Birla Group", etc.). If not found, return "Unknown".
+
+2. Interviewee Name: The full name of the person being interviewed (candidate). Look for patterns like "Candidate:", "Interviewee:", or names mentioned. If not found, return "Unknown".
+
+Return your response as a JSON object with these exact keys:
+- "company": string
+- "interviewee": string"""
+
+# === Structured output schemas ===
+class CompanyInterviewee(BaseModel):
+    company: str
+    interviewee: str
+
+
+class Boundary(BaseModel):
+    start_char: int
+    end_char: int
+
+
+class InterviewBoundaries(BaseModel):
+    has_multiple_interviews: bool
+    interviews: List[Boundary]
+
 
 # === Clients ===
-openai_client = OpenAI(api_key=os.environ["OPENAI_API_KEY"])
-pinecone_client = Pinecone(api_key=os.environ["PINECONE_API_KEY"])
-index = pinecone_client.Index(PINECONE_INDEX)
+# Created in main(), not at import: spawned page-extraction workers re-import this
+# module, and building the Pinecone index handle there would cost each of them a
+# describe_index round-trip and the API keys.
+async_openai: Optional[AsyncOpenAI] = None
+index = None
+
+# Concurrency limits and upload queue for the event loop (created in process_all_pdfs).
+# api_semaphore gates every outbound OpenAI request across all PDFs; records from
+# every PDF go through upsert_queue so small PDFs share Pinecone requests. A read_window
+# slot is held from reading a PDF's bytes until its text has been extracted.
+api_semaphore: Optional[asyncio.Semaphore] = None
+pdf_semaphore: Optional[asyncio.Semaphore] = None
+read_window: Optional[asyncio.Semaphore] = None
+upsert_queue: Optional[asyncio.Queue] = None
+chat_batcher: Optional["ChatBatcher"] = None
+cleaned_chunk_cache: Optional["LRUCache"] = None
+embedding_cache: Optional["LRUCache"] = None
+embedding_store: Optional["EmbeddingStore"] = None
+
+
+class ChatBatcher:
+    """Collect chat completion requests and run them through OpenAI's Batch API.
+    
+    Requests are gathered until no new ones arrive for BATCH_COLLECT_SECONDS, then
+    written to a .jsonl file, submitted as one batch, polled, and resolved by custom_id.
+    Pipeline stages therefore form natural batches: boundary detection for every PDF,
+    then extraction and cleaning for every interview. Identical requests share one
+    custom_id and are only sent once.
+    """
+    
+    def __init__(self):
+        self.pending: Dict[str, Tuple[Dict, asyncio.Future]] = {}
+        self.last_added = 0.0
+        self.collecting = False
+        self.submit_task: Optional[asyncio.Task] = None
+    
+    async def create(self, task_type: str, **body) -> ChatCompletion:
+        """Queue a request for the next batch and wait for its completion."""
+        loop = asyncio.get_running_loop()
+        body_hash = hashlib.sha256(json.dumps(body, sort_keys=True).encode("utf-8")).hexdigest()[:24]
+        custom_id = f"{task_type}-{body_hash}"
+        
+        if custom_id not in self.pending:
+            self.pending[custom_id] = (body, loop.create_future())
+        future = self.pending[custom_id][1]
+        self.last_added = loop.time()
+        
+        if not self.collecting:
+            self.collecting = True
+            # Keep a reference so the task isn't garbage-collected while it waits
+            self.submit_task = asyncio.create_task(self.submit_when_quiet())
+        
+        return await asyncio.shield(future)
+    
+    async def submit_when_quiet(self) -> None:
+        """Wait for requests to stop arriving, then submit everything pending as one batch."""
+        loop = asyncio.get_running_loop()
+        while loop.time() - self.last_added < BATCH_COLLECT_SECONDS:
+            await asyncio.sleep(BATCH_COLLECT_SECONDS)
+        
+        requests, self.pending = self.pending, {}
+        self.collecting = False
+        
+        try:
+            results = await self.run_batch({custom_id: body for custom_id, (body, _) in requests.items()})
+        except Exception as e:
+            results = {}
+            print(f"  ❌ OpenAI batch failed: {e}")
+        
+        for custom_id, (_, future) in requests.items():
+            if custom_id in results:
+                future.set_result(results[custom_id])
+            else:
+                future.set_exception(RuntimeError(f"No batch result for request {custom_id}"))
+    
+    async def run_batch(self, bodies: Dict[str, Dict]) -> Dict[str, ChatCompletion]:
+        """Upload, submit, and poll one batch; return successful completions by custom_id."""
+        lines = [
+            json.dumps({"custom_id": custom_id, "method": "POST", "url": "/v1/chat/completions", "body": body})
+            for custom_id, body in bodies.items()
+        ]
+        input_file = await async_openai.files.create(
+            file=("requests.jsonl", "\n".join(lines).encode("utf-8")),
+            purpose="batch"
+        )
+        batch = await async_openai.batches.create(
+            input_file_id=input_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h"
+        )
+        print(f"  📨 Submitted OpenAI batch {batch.id} with {len(lines)} request(s)")
+        
+        while batch.status not in ("completed", "failed", "expired", "cancelled"):
+            await asyncio.sleep(BATCH_POLL_SECONDS)
+            batch = await async_openai.batches.retrieve(batch.id)
+        
+        print(f"  📬 OpenAI batch {batch.id} {batch.status}")
+        if not batch.output_file_id:
+            return {}
+        
+        # Expired batches still return the requests that finished in time
+        output = await async_openai.files.content(batch.output_file_id)
+        results = {}
+        for line in output.text.splitlines():
+            if not line.strip():
+                continue
+            item = json.loads(line)
+            response = item.get("response") or {}
+            if response.get("status_code") == 200:
+                results[item["custom_id"]] = ChatCompletion.model_validate(response["body"])
+        return results
+
+
+def response_format_param(response_model: Type[BaseModel]) -> Dict:
+    """Return the response_format body that chat.completions.parse() would send for response_model."""
+    if type_to_response_format_param is None:
+        raise RuntimeError(
+            f"--batch-api needs openai.lib._parsing.type_to_response_format_param, which this openai "
+            f"version doesn't provide; install openai>={OPENAI_MIN_VERSION} or run without --batch-api"
+        )
+    return type_to_response_format_param(response_model)
+
+
+async def chat_completion(task_type: str, **params) -> ChatCompletion:
+    """Create a chat completion directly, or through the Batch API when BATCH_API is set."""
+    if BATCH_API:
+        return await chat_batcher.create(task_type, **params)
+    async with api_semaphore:
+        return await async_openai.chat.completions.create(**params)
+
+
+async def structured_completion(task_type: str, response_model: Type[BaseModel], **params) -> BaseModel:
+    """Create a chat completion whose reply is parsed into response_model via structured outputs."""
+    if BATCH_API:
+        # Batch requests are plain JSON bodies, so send the same schema parse() would
+        response = await chat_batcher.create(
+            task_type,
+            response_format=response_format_param(response_model),
+            **params
+        )
+        return response_model.model_validate_json(response.choices[0].message.content)
+    
+    async with api_semaphore:
+        response = await async_openai.chat.completions.parse(response_format=response_model, **params)
+    
+    message = response.choices[0].message
+    if message.parsed is None:
+        raise ValueError(f"No structured output returned: {message.refusal or 'empty response'}")
+    return message.parsed
 
-# Lock for thread-safe Pinecone operations
-pinecone_lock = Lock()
+
+def extract_page_text(page) -> str:
+    """Extract one page's text, falling back to pypdf's default mode if layout extraction fails."""
+    try:
+        text = page.extract_text(
+            extraction_mode=PDF_EXTRACTION_MODE,
+            layout_mode_space_vertically=False
+        )
+    except Exception:
+        # Older pypdf versions lack layout mode; some pages also fail to lay out
+        text = page.extract_text()
+    return text or ""
+
+
+def collapse_horizontal_space(text: str) -> str:
+    """Rejoin letter-spaced words, then collapse runs of spaces and trim them from line edges."""
+    # Rejoin first: collapsing would otherwise erase the wider gap that is the only
+    # separator between letter-spaced words
+    text = SPACED_LETTERS_RE.sub(lambda m: m.group(0).replace(' ', ''), text)
+    text = HORIZONTAL_SPACE_RE.sub(' ', text)
+    return LINE_EDGE_SPACE_RE.sub('\n', text)
 
 
-def extract_text_from_pdf(path: Path) -> str:
-    """Extract raw text from PDF."""
-    reader = PdfReader(str(path))
-    pages = []
+def extract_page_range(pdf_bytes: bytes, start: int, end: int) -> List[str]:
+    """Extract text from pages [start, end) of a PDF given as raw bytes."""
+    # Each worker opens its own reader: a PdfReader's stream is not safe to share
+    reader = PdfReader(io.BytesIO(pdf_bytes))
+    return [extract_page_text(reader.pages[i]) for i in range(start, end)]
+
+
+def extract_text_from_pdf(path: Path, pdf_bytes: Optional[bytes] = None) -> str:
+    """Extract raw text from PDF, parallelizing page extraction for larger files.
     
-    for page in reader.pages:
-        text = page.extract_text() or ""
-        if text.strip():
-            pages.append(text)
+    Small PDFs are extracted serially, medium ones across threads, and very large
+    ones across processes to escape the GIL. Pass pdf_bytes if the file was already read.
+    """
+    if pdf_bytes is None:
+        pdf_bytes = path.read_bytes()
+    reader = PdfReader(io.BytesIO(pdf_bytes))
+    num_pages = len(reader.pages)
+    
+    if num_pages <= PDF_SERIAL_MAX_PAGES:
+        texts = [extract_page_text(page) for page in reader.pages]
+    else:
+        workers = min(MAX_PAGE_WORKERS, num_pages)
+        step = -(-num_pages // workers)  # Ceiling division
+        ranges = [(start, min(start + step, num_pages)) for start in range(0, num_pages, step)]
+        
+        if num_pages <= PDF_THREADED_MAX_PAGES:
+            executor = ThreadPoolExecutor(max_workers=len(ranges))
+        else:
+            # Spawn, not fork: this runs inside a worker thread of a process that already
+            # has an event loop and client thread pools, which forked children can deadlock on
+            executor = ProcessPoolExecutor(
+                max_workers=len(ranges),
+                mp_context=multiprocessing.get_context("spawn")
+            )
+        
+        with executor:
+            # map preserves page order; workers get the bytes already read from disk
+            page_ranges = executor.map(
+                extract_page_range,
+                [pdf_bytes] * len(ranges),
+                [start for start, _ in ranges],
+                [end for _, end in ranges]
+            )
+            texts = [text for page_texts in page_ranges for text in page_texts]
     
-    return "\n\n".join(pages)
+    # Layout mode pads lines with runs of spaces; collapse them here so header
+    # detection, size thresholds and LLM excerpts all measure real content
+    return collapse_horizontal_space("\n\n".join(text for text in texts if text.strip())).strip()
+
 
+def break_offsets(pattern: re.Pattern, text: str) -> Tuple[List[int], List[int]]:
+    """Return the start and end offsets of every match of pattern in text, as two sorted lists."""
+    spans = [m.span() for m in pattern.finditer(text)]
+    return [s for s, _ in spans], [e for _, e in spans]
 
-def chunk_text_for_processing(text: str, chunk_size: int = 5000) -> List[str]:
-    """Split text into chunks that fit within token limits."""
-    if len(text) <= chunk_size:
+
+def last_break_before(breaks: Tuple[List[int], List[int]], start: int, end: int) -> Optional[int]:
+    """Return the end offset of the last break that begins after start and ends at or before end."""
+    break_starts, break_ends = breaks
+    k = bisect_right(break_ends, end) - 1
+    # Like rfind(...) > start: a break beginning exactly at start would leave a chunk of just the break
+    if k >= 0 and break_starts[k] > start:
+        return break_ends[k]
+    return None
+
+
+def chunk_text(text: str, max_chars: int, break_on_newline: bool = False) -> List[str]:
+    """Split text into chunks of at most max_chars, preferring paragraph then sentence boundaries.
+    
+    Boundary offsets are precomputed once, so locating each chunk's break is a bisect
+    instead of repeated rfind scans. With break_on_newline, single newlines also count
+    as sentence boundaries.
+    """
+    if len(text) <= max_chars:
         return [text]
     
+    sentence_re = SENTENCE_OR_LINE_BREAK_RE if break_on_newline else SENTENCE_BREAK_RE
+    paragraph_breaks = break_offsets(PARAGRAPH_BREAK_RE, text)
+    sentence_breaks = break_offsets(sentence_re, text)
+    
     chunks = []
     start = 0
     
     while start < len(text):
-        end = start + chunk_size
-        # Try to break at a sentence or paragraph boundary
+        end = start + max_chars
+        # Try to break at a paragraph boundary, then a sentence boundary
         if end < len(text):
-            # Look for paragraph break first
-            para_break = text.rfind('\n\n', start, end)
-            if para_break > start:
-                end = para_break + 2
-            else:
-                # Look for sentence break
-                sentence_break = max(
-                    text.rfind('. ', start, end),
-                    text.rfind('? ', start, end),
-                    text.rfind('! ', start, end)
-                )
-                if sentence_break > start:
-                    end = sentence_break + 2
+            end = (
+                last_break_before(paragraph_breaks, start, end)
+                or last_break_before(sentence_breaks, start, end)
+                or end
+            )
         
         chunk = text[start:end].strip()
         if chunk:
@@ -83,77 +426,191 @@ def chunk_text_for_processing(text: str, chunk_size: int = 5000) -> List[str]:
     return chunks
 
 
-def clean_text_chunk_with_openai(chunk: str) -> str:
-    """Clean a single text chunk using OpenAI."""
-    if not chunk or len(chunk.strip()) < 10:
-        return chunk
+def normalize_transcript_text(text: str) -> str:
+    """Fix the extraction artifacts left after extract_text_from_pdf: runs of blank lines.
     
-    prompt = f"""Clean and normalize this interview transcript text chunk. Fix any spacing issues (e.g., "v i e w e r" should become "viewer"). Remove excessive whitespace. Preserve the conversation structure between Interviewer and Candidate.
+    Letter-spaced words and repeated spaces are already fixed at extraction time.
+    """
+    text = EXCESS_NEWLINES_RE.sub('\n\n', text)
+    return text.strip()
 
-Raw text chunk:
-{chunk}
 
-Return only the cleaned text, nothing else."""
+def chunk_key(text: str) -> str:
+    """Hash a chunk of text for memoization."""
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+
+
+class LRUCache:
+    """A dict-backed cache that evicts the least recently used entry beyond maxsize."""
+    
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self.items: OrderedDict = OrderedDict()
+    
+    def get(self, key: str):
+        value = self.items.get(key)
+        if value is not None:
+            self.items.move_to_end(key)
+        return value
+    
+    def put(self, key: str, value):
+        self.items[key] = value
+        self.items.move_to_end(key)
+        if len(self.items) > self.maxsize:
+            self.items.popitem(last=False)
+    
+    def discard(self, key: str):
+        self.items.pop(key, None)
+
+
+class EmbeddingStore:
+    """Embeddings persisted in SQLite, keyed by chunk hash, so reruns skip unchanged chunks."""
+    
+    def __init__(self, path: Path):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(path)
+        self.conn.execute("CREATE TABLE IF NOT EXISTS embeddings (hash TEXT PRIMARY KEY, embedding BLOB NOT NULL)")
+    
+    def get(self, key: str) -> Optional[List[float]]:
+        row = self.conn.execute("SELECT embedding FROM embeddings WHERE hash = ?", (key,)).fetchone()
+        # Stored as float64 so cached vectors match freshly returned ones exactly
+        return array("d", row[0]).tolist() if row else None
+    
+    def put_many(self, embeddings: Dict[str, List[float]]):
+        with self.conn:
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO embeddings (hash, embedding) VALUES (?, ?)",
+                ((key, array("d", embedding).tobytes()) for key, embedding in embeddings.items())
+            )
+    
+    def close(self):
+        self.conn.close()
+
+
+async def request_cleaned_chunk(chunk: str) -> str:
+    """Ask OpenAI to clean a single text chunk."""
+    response = await chat_completion(
+        "clean",
+        model=CHAT_MODEL,
+        messages=[
+            {"role": "system", "content": CLEAN_SYSTEM_PROMPT},
+            {"role": "user", "content": f"Raw text chunk:\n{chunk}"}
+        ],
+        temperature=0.1,
+        max_tokens=8000  # Allow longer responses
+    )
+    return response.choices[0].message.content.strip()
+
+
+async def clean_text_chunk_with_openai(chunk: str) -> str:
+    """Clean a single text chunk using OpenAI, memoized by chunk hash."""
+    if not chunk or len(chunk.strip()) < 10:
+        return chunk
+    
+    # Identical chunks share one request, even while it is still in flight
+    key = chunk_key(chunk)
+    future = cleaned_chunk_cache.get(key)
+    if future is None:
+        future = asyncio.ensure_future(request_cleaned_chunk(chunk))
+        cleaned_chunk_cache.put(key, future)
     
     try:
-        response = openai_client.chat.completions.create(
-            model="gpt-4o-mini",
-            messages=[
-                {"role": "system", "content": "You clean and normalize interview transcript text. Return only the cleaned text."},
-                {"role": "user", "content": prompt}
-            ],
-            temperature=0.1,
-            max_tokens=8000  # Allow longer responses
-        )
-        return response.choices[0].message.content.strip()
+        return await asyncio.shield(future)
     except Exception as e:
+        if cleaned_chunk_cache.get(key) is future:
+            cleaned_chunk_cache.discard(key)  # Don't remember failures
         print(f"      ⚠️  Chunk cleaning failed: {e}, using original")
         return chunk
 
 
-def detect_interview_boundaries(raw_text: str) -> List[Tuple[int, int]]:
-    """Detect multiple interviews in a PDF and return their boundaries."""
-    # Use OpenAI to identify interview boundaries
-    # Sample first 10000 chars to detect pattern
-    sample_text = raw_text[:10000] if len(raw_text) > 10000 else raw_text
+async def clean_transcript(text: str) -> str:
+    """Clean a full transcript with regex normalization, or chunk-by-chunk with OpenAI if LLM_CLEAN is set."""
+    if not LLM_CLEAN:
+        return normalize_transcript_text(text)
+    
+    text_chunks = chunk_text(text, max_chars=5000)
+    print(f"      📦 Split into {len(text_chunks)} chunks for LLM cleaning")
     
-    prompt = f"""Analyze this PDF content and identify if it contains multiple separate interview transcripts. 
+    # Clean all chunks concurrently; gather preserves chunk order and
+    # clean_text_chunk_with_openai returns the original chunk on failure
+    cleaned_chunks = await asyncio.gather(
+        *(clean_text_chunk_with_openai(chunk) for chunk in text_chunks)
+    )
+    
+    # Combine cleaned chunks
+    return "\n\n".join(cleaned_chunks)
 
-Look for patterns like:
-- New sections starting with "Company:", "Interview with:", "Candidate:", "Round", etc.
-- Clear separators between different interviews
-- Different company names or interviewee names appearing
 
-If there are multiple interviews, identify the approximate character positions where each interview starts and ends.
+def disk_cache(model: Type[BaseModel], chat_model: str, system_prompt: str):
+    """Cache an async function of one text argument on disk, keyed by a SHA-256 of the function name and text.
+    
+    Results are pydantic `model` instances stored as JSON. Only successful results are
+    stored; if the wrapped function raises, nothing is cached. The key also covers the
+    chat model, the system prompt and `model`'s JSON schema, so changing any of them
+    misses the old entries instead of serving answers produced under other instructions.
+    """
+    request_hash = hashlib.sha256(
+        f"{chat_model}\n{system_prompt}\n{json.dumps(model.model_json_schema(), sort_keys=True)}".encode("utf-8")
+    ).hexdigest()
+    
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(text: str) -> BaseModel:
+            key = hashlib.sha256(f"{func.__name__}\n{request_hash}\n{text}".encode("utf-8")).hexdigest()
+            cache_path = CACHE_DIR / f"{key}.json"
+            
+            if cache_path.exists():
+                try:
+                    return model.model_validate_json(cache_path.read_text(encoding="utf-8"))
+                except (OSError, ValidationError):
+                    pass  # Unreadable or outdated cache entry - fall through and recompute
+            
+            result = await func(text)
+            
+            # Write atomically so concurrent tasks never read a partial file
+            CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            tmp_path = CACHE_DIR / f"{key}.{uuid.uuid4().hex}.tmp"
+            tmp_path.write_text(result.model_dump_json(), encoding="utf-8")
+            os.replace(tmp_path, cache_path)
+            
+            return result
+        
+        return wrapper
+    
+    return decorator
 
-Return JSON with:
-- "has_multiple_interviews": boolean
-- "interviews": array of objects with "start_char" and "end_char" positions (if multiple)
 
-If single interview, return:
-{{"has_multiple_interviews": false, "interviews": [{{"start_char": 0, "end_char": {len(raw_text)}}}]}}
+@disk_cache(InterviewBoundaries, CHAT_MODEL, BOUNDARIES_SYSTEM_PROMPT)
+async def request_interview_boundaries(raw_text: str) -> InterviewBoundaries:
+    """Ask OpenAI for interview boundaries in a PDF's text."""
+    # Use OpenAI to identify interview boundaries
+    # Sample first 10000 chars to detect pattern
+    sample_text = raw_text[:10000] if len(raw_text) > 10000 else raw_text
+    
+    prompt = f"""Document length: {len(raw_text)} characters
 
 Sample text:
-{sample_text[:8000]}
-"""
+{sample_text[:8000]}"""
     
+    return await structured_completion(
+        "boundaries",
+        InterviewBoundaries,
+        model=CHAT_MODEL,
+        messages=[
+            {"role": "system", "content": BOUNDARIES_SYSTEM_PROMPT},
+            {"role": "user", "content": prompt}
+        ],
+        temperature=0.1
+    )
+
+
+async def detect_interview_boundaries(raw_text: str) -> List[Tuple[int, int]]:
+    """Detect multiple interviews in a PDF and return their boundaries."""
     try:
-        response = openai_client.chat.completions.create(
-            model="gpt-4o-mini",
-            messages=[
-                {"role": "system", "content": "You analyze PDF content to identify interview boundaries. Return valid JSON."},
-                {"role": "user", "content": prompt}
-            ],
-            response_format={"type": "json_object"},
-            temperature=0.1
-        )
+        result = await request_interview_boundaries(raw_text)
         
-        result = json.loads(response.choices[0].message.content)
-        
-        if result.get("has_multiple_interviews", False):
-            interviews = result.get("interviews", [])
-            boundaries = [(int(i["start_char"]), int(i["end_char"])) for i in interviews]
-            return boundaries
+        if result.has_multiple_interviews:
+            return [(i.start_char, i.end_char) for i in result.interviews]
         else:
             # Single interview - return full text range
             return [(0, len(raw_text))]
@@ -163,9 +620,26 @@ Sample text:
         return [(0, len(raw_text))]
 
 
-def split_interviews_from_text(raw_text: str) -> List[str]:
-    """Split PDF text into individual interview transcripts."""
-    boundaries = detect_interview_boundaries(raw_text)
+def find_interview_boundaries(raw_text: str) -> List[Tuple[int, int]]:
+    """Split text at interview header lines ("Company:", "Interview with")."""
+    starts = [0]
+    for match in INTERVIEW_HEADER_RE.finditer(raw_text):
+        # Merge clustered headers (e.g. "Company: X" then "Interview with Y") into one interview
+        if match.start() - starts[-1] >= MIN_INTERVIEW_CHARS:
+            starts.append(match.start())
+    
+    return list(zip(starts, starts[1:] + [len(raw_text)]))
+
+
+async def split_interviews_from_text(raw_text: str) -> List[str]:
+    """Split PDF text into individual interview transcripts.
+    
+    Header regexes handle the common case; the LLM is only consulted when they find
+    a single segment in an unusually long document.
+    """
+    boundaries = find_interview_boundaries(raw_text)
+    if len(boundaries) == 1 and len(raw_text) > LLM_SPLIT_MIN_CHARS:
+        boundaries = await detect_interview_boundaries(raw_text)
     
     interviews = []
     for start, end in boundaries:
@@ -176,41 +650,32 @@ def split_interviews_from_text(raw_text: str) -> List[str]:
     return interviews if interviews else [raw_text]
 
 
-def extract_company_and_interviewee_with_openai(text_chunk: str) -> Tuple[str, str]:
-    """Extract company and interviewee from a transcript chunk."""
-    prompt = f"""You are analyzing an interview transcript. Extract:
-
-1. Company Name: The name of the company conducting the interview (e.g., "KPMG", "BITSvertise", "Aditya Birla Group", etc.). If not found, return "Unknown".
+@disk_cache(CompanyInterviewee, CHAT_MODEL, ENTITIES_SYSTEM_PROMPT)
+async def request_company_and_interviewee(text_chunk: str) -> CompanyInterviewee:
+    """Ask OpenAI for the company and interviewee in a transcript chunk."""
+    return await structured_completion(
+        "entities",
+        CompanyInterviewee,
+        model=CHAT_MODEL,
+        messages=[
+            {"role": "system", "content": ENTITIES_SYSTEM_PROMPT},
+            {"role": "user", "content": f"Transcript excerpt:\n{text_chunk[:6000]}"}
+        ],
+        temperature=0.1
+    )
 
-2. Interviewee Name: The full name of the person being interviewed (candidate). Look for patterns like "Candidate:", "Interviewee:", or names mentioned. If not found, return "Unknown".
 
-Return your response as a JSON object with these exact keys:
-- "company": string
-- "interviewee": string
-
-Transcript excerpt:
-{text_chunk[:6000]}
-"""
-    
+async def extract_company_and_interviewee_with_openai(text_chunk: str) -> Tuple[str, str]:
+    """Extract company and interviewee from a transcript chunk."""
     try:
-        response = openai_client.chat.completions.create(
-            model="gpt-4o-mini",
-            messages=[
-                {"role": "system", "content": "You extract structured information from interview transcripts. Always return valid JSON."},
-                {"role": "user", "content": prompt}
-            ],
-            response_format={"type": "json_object"},
-            temperature=0.1
-        )
-        
-        result = json.loads(response.choices[0].message.content)
-        return result.get("company", "Unknown"), result.get("interviewee", "Unknown")
+        result = await request_company_and_interviewee(text_chunk)
+        return result.company, result.interviewee
     except Exception as e:
         print(f"      ⚠️  Company/interviewee extraction failed: {e}")
         return "Unknown", "Unknown"
 
 
-def extract_structured_info_with_openai(raw_text: str) -> Dict[str, str]:
+async def extract_structured_info_with_openai(raw_text: str) -> Dict[str, str]:
     """Use OpenAI to extract company name, interviewee name, and clean transcript."""
     if not raw_text or len(raw_text.strip()) < 50:
         return {
@@ -222,35 +687,11 @@ def extract_structured_info_with_openai(raw_text: str) -> Dict[str, str]:
     # Extract company and interviewee from first chunk
     print(f"    📋 Extracting company and interviewee names...")
     first_chunk = raw_text[:6000]  # First 6000 chars should have company/interviewee info
-    company, interviewee = extract_company_and_interviewee_with_openai(first_chunk)
-    
-    # Split transcript into chunks for cleaning
-    print(f"    🧹 Cleaning transcript in chunks...")
-    text_chunks = chunk_text_for_processing(raw_text, chunk_size=5000)
-    print(f"    📦 Split into {len(text_chunks)} chunks for processing")
-    
-    # Clean each chunk in parallel
-    cleaned_chunks = []
-    with ThreadPoolExecutor(max_workers=4) as executor:
-        future_to_chunk = {
-            executor.submit(clean_text_chunk_with_openai, chunk): i 
-            for i, chunk in enumerate(text_chunks)
-        }
-        
-        results = [None] * len(text_chunks)
-        for future in as_completed(future_to_chunk):
-            chunk_idx = future_to_chunk[future]
-            try:
-                cleaned = future.result()
-                results[chunk_idx] = cleaned
-            except Exception as e:
-                print(f"      ⚠️  Error cleaning chunk {chunk_idx}: {e}")
-                results[chunk_idx] = text_chunks[chunk_idx]  # Use original if cleaning fails
-        
-        cleaned_chunks = results
+    company, interviewee = await extract_company_and_interviewee_with_openai(first_chunk)
     
-    # Combine cleaned chunks
-    cleaned_transcript = "\n\n".join(cleaned_chunks)
+    # Clean transcript
+    print(f"    🧹 Cleaning transcript...")
+    cleaned_transcript = await clean_transcript(raw_text)
     
     return {
         "company": company,
@@ -259,41 +700,125 @@ def extract_structured_info_with_openai(raw_text: str) -> Dict[str, str]:
     }
 
 
-def chunk_for_embedding(text: str, max_chars: int = 6000) -> List[str]:
-    """Split text into chunks suitable for embedding (stays under token limits)."""
-    if len(text) <= max_chars:
-        return [text]
+def batch_for_embedding(texts: List[str]) -> List[List[int]]:
+    """Group text indices into sub-batches bounded by input count and approximate token count.
     
-    chunks = []
-    start = 0
+    Indices are sorted longest-first so each sub-batch holds similar-length texts and
+    no single long chunk straggles behind short ones. Callers scatter results back by index.
+    """
+    batches = []
+    current = []
+    current_tokens = 0
     
-    while start < len(text):
-        end = start + max_chars
-        if end < len(text):
-            # Try to break at paragraph boundary
-            para_break = text.rfind('\n\n', start, end)
-            if para_break > start:
-                end = para_break + 2
-            else:
-                # Try sentence boundary
-                sentence_break = max(
-                    text.rfind('. ', start, end),
-                    text.rfind('? ', start, end),
-                    text.rfind('! ', start, end),
-                    text.rfind('\n', start, end)
+    for i in sorted(range(len(texts)), key=lambda i: -len(texts[i])):
+        # Rough estimate: ~4 characters per token
+        tokens = len(texts[i]) // 4 + 1
+        if current and (len(current) >= EMBED_BATCH_SIZE or current_tokens + tokens > EMBED_BATCH_MAX_TOKENS):
+            batches.append(current)
+            current = []
+            current_tokens = 0
+        current.append(i)
+        current_tokens += tokens
+    
+    if current:
+        batches.append(current)
+    
+    return batches
+
+
+async def embed_batch(texts: List[str]) -> List[Optional[List[float]]]:
+    """Embed one sub-batch, falling back to per-item requests if the batch fails."""
+    async with api_semaphore:
+        try:
+            response = await async_openai.embeddings.create(
+                model=EMBED_MODEL,
+                input=texts,
+                dimensions=EMBED_DIMENSION,
+            )
+            # Embeddings are returned in input order
+            return [item.embedding for item in response.data]
+        except Exception as e:
+            print(f"      ⚠️  Batch embedding failed ({len(texts)} chunks): {e}, retrying individually")
+    
+    embeddings: List[Optional[List[float]]] = []
+    for text in texts:
+        async with api_semaphore:
+            try:
+                response = await async_openai.embeddings.create(
+                    model=EMBED_MODEL,
+                    input=text,
+                    dimensions=EMBED_DIMENSION,
                 )
-                if sentence_break > start:
-                    end = sentence_break + 2
+                embeddings.append(response.data[0].embedding)
+            except Exception as e:
+                print(f"      ⚠️  Embedding failed for chunk: {e}")
+                embeddings.append(None)
+    return embeddings
+
+
+def embedding_key(text: str) -> str:
+    """Hash a chunk for the embedding caches; the model and dimension are part of the key."""
+    return chunk_key(f"{EMBED_MODEL}:{EMBED_DIMENSION}\n{text}")
+
+
+async def aembed_texts(texts: List[str]) -> List[Optional[List[float]]]:
+    """Embed texts in concurrent batched requests, preserving input order. Failed inputs map to None.
+    
+    Embeddings are memoized by chunk hash in memory (and in SQLite with --embedding-cache),
+    so identical chunks (in practice, from duplicate documents or a re-run) are only sent once,
+    including ones another PDF is embedding right now.
+    """
+    loop = asyncio.get_running_loop()
+    keys = [embedding_key(text) for text in texts]
+    futures: Dict[str, asyncio.Future] = {}
+    to_embed: List[Tuple[str, str]] = []
+    
+    for key, text in zip(keys, texts):
+        if key in futures:
+            continue
+        future = embedding_cache.get(key)
+        if future is None:
+            future = loop.create_future()
+            stored = embedding_store.get(key) if embedding_store else None
+            if stored is not None:
+                future.set_result(stored)
+            else:
+                to_embed.append((key, text))
+            embedding_cache.put(key, future)
+        futures[key] = future
+    
+    new_embeddings: Dict[str, List[float]] = {}
+    try:
+        batches = batch_for_embedding([text for _, text in to_embed])
+        results = await asyncio.gather(
+            *(embed_batch([to_embed[i][1] for i in batch]) for batch in batches),
+            return_exceptions=True
+        )
         
-        chunk = text[start:end].strip()
-        if chunk:
-            chunks.append(chunk)
-        start = end
+        for batch, result in zip(batches, results):
+            if isinstance(result, BaseException):
+                print(f"      ⚠️  Embedding failed for {len(batch)} chunks: {result}")
+                continue
+            for i, embedding in zip(batch, result):
+                key = to_embed[i][0]
+                futures[key].set_result(embedding)
+                if embedding is not None:
+                    new_embeddings[key] = embedding
+    finally:
+        # Resolve anything left so other PDFs waiting on these chunks never hang
+        for key, _ in to_embed:
+            if not futures[key].done():
+                futures[key].set_result(None)
+            if key not in new_embeddings:
+                embedding_cache.discard(key)  # Don't remember failures
     
-    return chunks
+    if embedding_store and new_embeddings:
+        embedding_store.put_many(new_embeddings)
+    
+    return [await asyncio.shield(futures[key]) for key in keys]
 
 
-def create_transcript_records(
+async def acreate_transcript_records(
     company: Optional[str],
     interviewee: Optional[str],
     transcript_text: str,
@@ -302,25 +827,24 @@ def create_transcript_records(
 ) -> List[Dict]:
     """Create multiple Pinecone records for a transcript, chunking if necessary."""
     # Chunk transcript for embedding (max 6000 chars per chunk to stay under token limit)
-    transcript_chunks = chunk_for_embedding(transcript_text, max_chars=6000)
+    transcript_chunks = chunk_text(transcript_text, max_chars=6000, break_on_newline=True)
+    
+    # Create searchable text with metadata
+    searchable_texts = [
+        f"Company: {company or 'Unknown'}\n"
+        f"Interviewee: {interviewee or 'Unknown'}\n"
+        f"Transcript excerpt:\n{transcript_chunk}"
+        for transcript_chunk in transcript_chunks
+    ]
+    
+    # Generate all embeddings in concurrent batched requests
+    embeddings = await aembed_texts(searchable_texts)
     
     records = []
     
-    for i, chunk_text in enumerate(transcript_chunks):
-        # Create searchable text with metadata
-        searchable_text = f"Company: {company or 'Unknown'}\n"
-        searchable_text += f"Interviewee: {interviewee or 'Unknown'}\n"
-        searchable_text += f"Transcript excerpt:\n{chunk_text}"
-        
-        # Generate embedding
-        try:
-            embedding = openai_client.embeddings.create(
-                model=EMBED_MODEL,
-                input=searchable_text,
-            ).data[0].embedding
-        except Exception as e:
-            print(f"      ⚠️  Embedding failed for chunk {i+1}: {e}")
-            # Skip this chunk if embedding fails
+    for i, (transcript_chunk, embedding) in enumerate(zip(transcript_chunks, embeddings)):
+        # Skip this chunk if embedding failed
+        if embedding is None:
             continue
         
         records.append({
@@ -329,7 +853,7 @@ def create_transcript_records(
             "metadata": {
                 "company": company or "Unknown",
                 "interviewee": interviewee or "Unknown",
-                "transcript": chunk_text,
+                "transcript": transcript_chunk,
                 "chunk_index": i,
                 "total_chunks": len(transcript_chunks),
                 "source_name": source_filename,
@@ -343,7 +867,7 @@ def create_transcript_records(
     return records
 
 
-def process_single_interview(
+async def process_single_interview(
     interview_text: str,
     interview_num: int,
     total_interviews: int,
@@ -353,40 +877,20 @@ def process_single_interview(
     """Process a single interview transcript and return Pinecone records."""
     print(f"    📝 Processing interview {interview_num}/{total_interviews}...")
     
-    # Extract company and interviewee from first chunk
+    # Extract company and interviewee from first chunk while cleaning the transcript;
+    # neither depends on the other, so in batch mode both land in the same batch
     first_chunk = interview_text[:6000]
-    company, interviewee = extract_company_and_interviewee_with_openai(first_chunk)
-    
-    # Clean the transcript
     print(f"      🧹 Cleaning transcript...")
-    text_chunks = chunk_text_for_processing(interview_text, chunk_size=5000)
-    
-    cleaned_chunks = []
-    with ThreadPoolExecutor(max_workers=4) as executor:
-        future_to_chunk = {
-            executor.submit(clean_text_chunk_with_openai, chunk): i 
-            for i, chunk in enumerate(text_chunks)
-        }
-        
-        results = [None] * len(text_chunks)
-        for future in as_completed(future_to_chunk):
-            chunk_idx = future_to_chunk[future]
-            try:
-                cleaned = future.result()
-                results[chunk_idx] = cleaned
-            except Exception as e:
-                print(f"        ⚠️  Error cleaning chunk {chunk_idx}: {e}")
-                results[chunk_idx] = text_chunks[chunk_idx]
-        
-        cleaned_chunks = results
-    
-    cleaned_transcript = "\n\n".join(cleaned_chunks)
+    (company, interviewee), cleaned_transcript = await asyncio.gather(
+        extract_company_and_interviewee_with_openai(first_chunk),
+        clean_transcript(interview_text)
+    )
     
     print(f"      Company: {company}, Interviewee: {interviewee}")
     print(f"      Cleaned length: {len(cleaned_transcript)} chars")
     
     # Create records
-    records = create_transcript_records(
+    records = await acreate_transcript_records(
         company=company,
         interviewee=interviewee,
         transcript_text=cleaned_transcript,
@@ -397,14 +901,84 @@ def process_single_interview(
     return records
 
 
-def process_pdf(pdf_path: Path) -> int:
-    """Process a single PDF and return number of records created."""
+def estimate_record_bytes(record: Dict) -> int:
+    """Estimate the serialized size of a record in an upsert request."""
+    return len(record["values"]) * EST_BYTES_PER_VALUE + len(json.dumps(record["metadata"]))
+
+
+def wait_for_upserts(handles: List[Tuple[object, int]]) -> int:
+    """Block until all async upserts finish and return the number of records stored."""
+    stored = 0
+    for handle, batch_len in handles:
+        try:
+            handle.get()
+            stored += batch_len
+        except Exception as e:
+            print(f"  ❌ Pinecone upsert of {batch_len} record(s) failed: {e}")
+    return stored
+
+
+async def upsert_worker() -> int:
+    """Drain records from every PDF into shared Pinecone batches until a None sentinel arrives.
+    
+    Batches are capped by both BATCH_SIZE and UPSERT_MAX_BYTES and dispatched with
+    async_req=True, so uploads run on the Pinecone client's thread pool while
+    ingestion continues. Returns the number of records successfully upserted.
+    """
+    handles = []
+    batch = []
+    batch_bytes = 0
+    
+    def flush():
+        nonlocal batch, batch_bytes
+        try:
+            handle = index.upsert(vectors=batch, namespace=PINECONE_NAMESPACE, async_req=True)
+            handles.append((handle, len(batch)))
+        except Exception as e:
+            # Errors raised before dispatch (validation, auth) lose only this batch;
+            # the worker keeps draining the queue
+            print(f"  ❌ Pinecone upsert of {len(batch)} record(s) failed: {e}")
+        batch = []
+        batch_bytes = 0
+    
+    while True:
+        record = await upsert_queue.get()
+        if record is None:
+            break
+        
+        record_bytes = estimate_record_bytes(record)
+        if batch and (len(batch) >= BATCH_SIZE or batch_bytes + record_bytes > UPSERT_MAX_BYTES):
+            flush()
+        batch.append(record)
+        batch_bytes += record_bytes
+    
+    if batch:
+        flush()
+    
+    print(f"\n📦 Waiting for {len(handles)} Pinecone upsert request(s) to finish...")
+    return await asyncio.to_thread(wait_for_upserts, handles)
+
+
+async def process_pdf(pdf_path: Path, pdf_bytes: bytes) -> int:
+    """Process a single PDF (already read into memory) and return number of records created.
+    
+    The PDF's read_window slot is released, and its bytes dropped, once the text is extracted.
+    """
     print(f"\n{'='*60}")
     print(f"Processing: {pdf_path.name}")
     print(f"{'='*60}")
     
-    # Extract raw text from PDF
-    raw_text = extract_text_from_pdf(pdf_path)
+    # Extract raw text from PDF (blocking work runs off the event loop). In batch mode
+    # the PDF cap covers only this step; see process_all_pdfs
+    try:
+        if BATCH_API:
+            async with pdf_semaphore:
+                raw_text = await asyncio.to_thread(extract_text_from_pdf, pdf_path, pdf_bytes)
+        else:
+            raw_text = await asyncio.to_thread(extract_text_from_pdf, pdf_path, pdf_bytes)
+    finally:
+        del pdf_bytes
+        read_window.release()
     if not raw_text or len(raw_text.strip()) < 100:
         print(f"  ⚠️  No meaningful text extracted from {pdf_path.name}")
         return 0
@@ -413,49 +987,140 @@ def process_pdf(pdf_path: Path) -> int:
     
     # Detect and split multiple interviews
     print(f"  🔍 Detecting interview boundaries...")
-    interview_texts = split_interviews_from_text(raw_text)
+    interview_texts = await split_interviews_from_text(raw_text)
     print(f"  Found {len(interview_texts)} interview(s) in this PDF")
     
     if not interview_texts:
         print(f"  ⚠️  No interviews detected")
         return 0
     
-    # Process each interview
-    all_records = []
-    for i, interview_text in enumerate(interview_texts, 1):
-        try:
-            records = process_single_interview(
+    # Process all interviews concurrently
+    results = await asyncio.gather(
+        *(
+            process_single_interview(
                 interview_text=interview_text,
                 interview_num=i,
                 total_interviews=len(interview_texts),
                 source_filename=pdf_path.name,
                 source_path=str(pdf_path.resolve())
             )
-            all_records.extend(records)
-        except Exception as e:
-            print(f"    ❌ Error processing interview {i}: {e}")
+            for i, interview_text in enumerate(interview_texts, 1)
+        ),
+        return_exceptions=True
+    )
+    
+    all_records = []
+    for i, result in enumerate(results, 1):
+        if isinstance(result, BaseException):
+            print(f"    ❌ Error processing interview {i}: {result}")
             import traceback
-            traceback.print_exc()
+            traceback.print_exception(type(result), result, result.__traceback__)
             continue
+        all_records.extend(result)
     
     if not all_records:
         print(f"  ⚠️  No records created from this PDF")
         return 0
     
-    # Upsert all records to Pinecone in batches (thread-safe)
-    print(f"  📦 Uploading {len(all_records)} record(s) to Pinecone...")
-    with pinecone_lock:
-        for i in range(0, len(all_records), BATCH_SIZE):
-            batch = all_records[i:i + BATCH_SIZE]
-            index.upsert(vectors=batch, namespace=PINECONE_NAMESPACE)
+    # Hand records to the shared upsert worker
+    for record in all_records:
+        upsert_queue.put_nowait(record)
     
-    print(f"  ✅ Successfully ingested {len(all_records)} record(s) from {len(interview_texts)} interview(s)")
+    print(f"  ✅ Queued {len(all_records)} record(s) from {len(interview_texts)} interview(s) for upload")
     
     return len(all_records)
 
 
+async def process_all_pdfs(pdf_paths: List[Path]) -> int:
+    """Process all PDFs concurrently on one event loop and return the number of records upserted."""
+    global api_semaphore, pdf_semaphore, read_window, upsert_queue, chat_batcher
+    global cleaned_chunk_cache, embedding_cache, embedding_store
+    api_semaphore = asyncio.Semaphore(API_MAX_CONCURRENCY)
+    pdf_semaphore = asyncio.Semaphore(MAX_PDF_WORKERS)  # Process up to 4 PDFs in parallel
+    read_window = asyncio.Semaphore(PDF_READ_AHEAD)
+    upsert_queue = asyncio.Queue()
+    chat_batcher = ChatBatcher()
+    cleaned_chunk_cache = LRUCache(CLEAN_CACHE_SIZE)
+    embedding_cache = LRUCache(EMBED_CACHE_SIZE)
+    embedding_store = EmbeddingStore(EMBEDDING_STORE_PATH) if EMBEDDING_CACHE else None
+    upserter = asyncio.create_task(upsert_worker())
+    
+    # Read PDFs from disk ahead of their turn so file I/O (slow on network mounts)
+    # overlaps with parsing and API calls for earlier PDFs. Reads start in order as
+    # read_window slots free up, so at most PDF_READ_AHEAD files are held in memory
+    loop = asyncio.get_running_loop()
+    read_executor = ThreadPoolExecutor(max_workers=PDF_READ_AHEAD)
+    
+    async def read_pdf(pdf_path: Path) -> bytes:
+        await read_window.acquire()
+        try:
+            return await loop.run_in_executor(read_executor, pdf_path.read_bytes)
+        except BaseException:
+            read_window.release()
+            raise
+    
+    pdf_reads = {pdf_path: asyncio.create_task(read_pdf(pdf_path)) for pdf_path in pdf_paths}
+    
+    async def process_pdf_bounded(pdf_path: Path) -> int:
+        if BATCH_API:
+            # A batched request only resolves when its whole batch does, so holding the
+            # cap through the LLM stages would run one batch per group of PDFs in turn;
+            # process_pdf applies it to text extraction alone
+            return await process_pdf(pdf_path, await pdf_reads.pop(pdf_path))
+        async with pdf_semaphore:
+            return await process_pdf(pdf_path, await pdf_reads.pop(pdf_path))
+    
+    # Wait for every PDF, keeping per-PDF failures isolated
+    try:
+        results = await asyncio.gather(
+            *(process_pdf_bounded(pdf_path) for pdf_path in pdf_paths),
+            return_exceptions=True
+        )
+    finally:
+        read_executor.shutdown(wait=False)
+        if embedding_store:
+            embedding_store.close()
+    
+    for pdf_path, result in zip(pdf_paths, results):
+        if isinstance(result, BaseException):
+            print(f"\n  ❌ Error processing {pdf_path.name}: {result}")
+            import traceback
+            traceback.print_exception(type(result), result, result.__traceback__)
+    
+    # Signal the upsert worker that no more records are coming
+    upsert_queue.put_nowait(None)
+    return await upserter
+
+
 def main():
     """Main function to process all PDFs in the transcripts folder."""
+    global LLM_CLEAN, BATCH_API, EMBEDDING_CACHE, async_openai, index
+    parser = argparse.ArgumentParser(description="Ingest transcript PDFs into Pinecone.")
+    parser.add_argument(
+        "--llm-clean",
+        action="store_true",
+        help="Clean transcripts with gpt-4o-mini instead of regex normalization (slower, costs API calls)",
+    )
+    parser.add_argument(
+        "--batch-api",
+        action="store_true",
+        help="Send gpt-4o-mini requests through OpenAI's Batch API (about half the cost, may take hours)",
+    )
+    parser.add_argument(
+        "--embedding-cache",
+        action="store_true",
+        help=f"Reuse embeddings of previously seen chunks from {EMBEDDING_STORE_PATH}",
+    )
+    args = parser.parse_args()
+    LLM_CLEAN = args.llm_clean
+    BATCH_API = args.batch_api
+    EMBEDDING_CACHE = args.embedding_cache
+    
+    async_openai = AsyncOpenAI(api_key=os.environ["OPENAI_API_KEY"])
+    index = Pinecone(api_key=os.environ["PINECONE_API_KEY"]).Index(
+        PINECONE_INDEX, pool_threads=PINECONE_POOL_THREADS
+    )
+    
     print("=" * 60)
     print("Transcript PDF Ingestion Script (AI-Powered + Parallel)")
     print("=" * 60)
@@ -464,9 +1129,20 @@ def main():
     print(f"Namespace: {PINECONE_NAMESPACE}")
     print(f"Embedding Model: {EMBED_MODEL} ({EMBED_DIMENSION} dimensions)")
     print(f"Extraction: Using OpenAI GPT-4o-mini for structured extraction")
+    print(f"Cleaning: {'OpenAI GPT-4o-mini (--llm-clean)' if LLM_CLEAN else 'Regex normalization'}")
+    print(f"LLM requests: {'OpenAI Batch API (--batch-api)' if BATCH_API else 'Realtime'}")
+    print(f"Embedding cache: {EMBEDDING_STORE_PATH if EMBEDDING_CACHE else 'In-memory only'}")
     print(f"Processing: Parallel execution enabled (up to 4 PDFs simultaneously)")
     print("=" * 60)
     
+    # Fail before any PDF work if the installed openai lacks what these modes call
+    if not hasattr(async_openai.chat.completions, "parse"):
+        print(f"\n❌ Error: structured outputs need openai>={OPENAI_MIN_VERSION} (pip install -U openai)")
+        return
+    if BATCH_API and type_to_response_format_param is None:
+        print(f"\n❌ Error: --batch-api needs openai>={OPENAI_MIN_VERSION} (pip install -U openai)")
+        return
+    
     # Check if PDF folder exists
     if not PDF_FOLDER.exists():
         print(f"\n❌ Error: PDF folder not found: {PDF_FOLDER.resolve()}")
@@ -485,32 +1161,12 @@ def main():
         print(f"  - {pdf_path.name}")
     
     # Ask user for parallel processing preference
-    print(f"\n💡 Processing with parallel execution (using ThreadPoolExecutor)")
+    print(f"\n💡 Processing with parallel execution (single asyncio event loop)")
     print(f"   Will process multiple PDFs simultaneously for faster ingestion")
     
     # Process PDFs in parallel
-    total_records = 0
     start_time = time.time()
-    max_workers = min(4, len(pdf_paths))  # Process up to 4 PDFs in parallel
-    
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        # Submit all PDFs for processing
-        future_to_pdf = {
-            executor.submit(process_pdf, pdf_path): pdf_path 
-            for pdf_path in pdf_paths
-        }
-        
-        # Collect results as they complete
-        for future in as_completed(future_to_pdf):
-            pdf_path = future_to_pdf[future]
-            try:
-                count = future.result()
-                total_records += count
-            except Exception as e:
-                print(f"\n  ❌ Error processing {pdf_path.name}: {e}")
-                import traceback
-                traceback.print_exc()
-                continue
+    total_records = asyncio.run(process_all_pdfs(pdf_paths))
     
     elapsed_time = time.time() - start_time
     
@@ -62,26 +62,28 @@ def process_manual_data(input_file: str = "data/linkedin_alumni_manual.json"):
         companies = person.get("companies", [])
         all_companies.update(companies)
     
+    # Sort once and reuse for both outputs
+    sorted_companies = sorted(all_companies)
+    
     # Save results
     output = {
         "processed_at": datetime.now().isoformat(),
         "total_alumni": len(alumni),
-        "total_companies": len(all_companies),
-        "companies": sorted(list(all_companies)),
+        "total_companies": len(sorted_companies),
+        "companies": sorted_companies,
         "alumni": alumni
     }
     
     # Save JSON
+    os.makedirs("data", exist_ok=True)
     with open("data/bitcom_linkedin_alumni.json", "w", encoding="utf-8") as f:
         json.dump(output, f, indent=2, ensure_ascii=False)
     
     # Save CSV
-    os.makedirs("data", exist_ok=True)
     with open("data/bitcom_companies.csv", "w", newline="", encoding="utf-8") as f:
         writer = csv.writer(f)
         writer.writerow(["Company Name"])
-        for company in sorted(all_companies):
-            writer.writerow([company])
+        writer.writerows([company] for company in sorted_companies)
     
     print(f"✅ Processed {len(alumni)} alumni profiles")
     print(f"✅ Found {len(all_companies)} unique companies")
@@ -5,45 +5,366 @@ Script to search LinkedIn for BITSoM MBA alumni and extract their work history.
 This script is for educational purposes only. Use at your own risk.
 
 Requirements:
-- pip install selenium beautifulsoup4 pandas
+- pip install selenium beautifulsoup4 requests lxml
 - Chrome/Chromium browser
 - ChromeDriver installed and in PATH
+- Optional: pip install orjson (faster JSON output)
+- Optional: pip install playwright && playwright install chromium
+  (concurrent headless browser for profiles that can't be fetched over HTTP)
 """
 
 import os
 import sys
 import time
+import asyncio
 import json
 import csv
 import re
-from typing import List, Dict, Optional
+import queue
+import random
+import threading
+import importlib.util
+from concurrent.futures import ThreadPoolExecutor
+from html import unescape
+from urllib.parse import urlsplit
+from typing import List, Dict, Optional, Tuple
 from datetime import datetime
 
 # Check and import required packages
 try:
     from selenium import webdriver
     from selenium.webdriver.common.by import By
+    from selenium.webdriver.chrome.service import Service
     from selenium.webdriver.common.keys import Keys
     from selenium.webdriver.support.ui import WebDriverWait
     from selenium.webdriver.support import expected_conditions as EC
     from selenium.common.exceptions import TimeoutException, NoSuchElementException
-    from bs4 import BeautifulSoup
-    import pandas as pd
-    # Try to use webdriver-manager for automatic ChromeDriver management
-    try:
-        from selenium.webdriver.chrome.service import Service
-        from webdriver_manager.chrome import ChromeDriverManager
-        USE_WEBDRIVER_MANAGER = True
-    except ImportError:
-        USE_WEBDRIVER_MANAGER = False
-        print("💡 Tip: Install webdriver-manager for automatic ChromeDriver setup:")
-        print("   pip install webdriver-manager")
+    from bs4 import BeautifulSoup, SoupStrainer
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
 except ImportError as e:
     print("❌ Missing required packages. Install with:")
-    print("   pip install selenium beautifulsoup4 pandas webdriver-manager")
+    print("   pip install selenium beautifulsoup4 requests lxml webdriver-manager")
     print(f"\n   Error: {e}")
     sys.exit(1)
 
+# Use webdriver-manager for automatic ChromeDriver management if it's installed;
+# it's only imported when a driver is actually created
+USE_WEBDRIVER_MANAGER = importlib.util.find_spec('webdriver_manager') is not None
+
+# orjson is optional: a C JSON serializer, several times faster than the json module
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Playwright is optional: without it, browser fallbacks use a pool of Selenium drivers
+try:
+    from playwright.async_api import async_playwright, TimeoutError as PlaywrightTimeoutError
+except ImportError:
+    async_playwright = None
+
+
+# Shared by the browser and the HTTP session so LinkedIn sees one client
+USER_AGENT = 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+
+# Profile pages are parsed down to the tags we read (name heading, sections, links);
+# nav, ads, scripts and footer never become Python objects
+PROFILE_STRAINER = SoupStrainer(['h1', 'section', 'a'])
+
+# Name headings in order of preference; a bare <h1> is the last resort
+NAME_HEADING_CLASSES = ('text-heading-xlarge', 'top-card-layout__title', 'pv-text-details__left-panel')
+
+# Byte-level patterns for the fast path over raw profile HTML (BeautifulSoup is the fallback)
+NAME_RES = [
+    re.compile(rb'<h1\b[^>]*\bclass="(?:[^"]*\s)?' + re.escape(cls.encode()) + rb'(?=[\s"])[^"]*"[^>]*>\s*([^<]{1,200}?)\s*</h1>')
+    for cls in NAME_HEADING_CLASSES
+] + [re.compile(rb'<h1\b[^>]*>\s*([^<]{1,200}?)\s*</h1>')]
+EXPERIENCE_SECTION_RE = re.compile(rb'<section\b[^>]*\bid="experience"')
+COMPANY_LINK_RE = re.compile(rb'<a\b[^>]*\bhref="[^"]*/company/[^"]*"[^>]*>\s*([^<]{1,99}?)\s*<')
+# Company links or t-14/t-16 spans; group 1 is set for spans
+EXPERIENCE_COMPANY_RE = re.compile(
+    rb'(?:<a\b[^>]*\bhref="[^"]*/company/[^"]*"|(<span)\b[^>]*\bclass="[^"]*\bt-1[46]\b[^"]*")[^>]*>\s*([^<]{1,99}?)\s*<'
+)
+# Span text containing any of these words is a date, duration or job type, not a company
+COMPANY_BLACKLIST_RE = re.compile(
+    r'\b(?:present|full-?time|part-?time|intern|months?|years?|mos?|yrs?|'
+    r'jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)\b',
+    re.IGNORECASE
+)
+
+PROFILE_WORKERS = 8  # Profiles fetched concurrently (overall rate still set by the rate limiter)
+HTTP_POOL_CONNECTIONS = 16  # Hosts with a pooled connection kept open
+HTTP_POOL_MAXSIZE = 32  # Keep-alive connections per host (more than PROFILE_WORKERS)
+BROWSER_POOL_SIZE = 3  # Max Chrome instances for profiles that need a real browser
+COOKIES_FILE = "data/linkedin_cookies.json"  # Saved login session, reused by later runs
+PROGRESS_FILE = "data/bitcom_linkedin_alumni.jsonl"  # One line appended per scraped profile
+
+# Login state, detected from the URL and a few element lookups (never the full page source)
+CHALLENGE_URL_RE = re.compile(r'challenge|checkpoint|security', re.IGNORECASE)
+LOGGED_IN_URL_RE = re.compile(r'feed|mynetwork|linkedin\.com/in/')
+
+# The /in/<slug> part of a profile URL; anything after the slug (/details/..., /overlay/...) is dropped
+PROFILE_PATH_RE = re.compile(r'^/in/([^/]+)')
+CHALLENGE_INPUT_SELECTOR = (
+    'input[name="pin"], input[name="challenge"], #input__phone_verification_pin, '
+    '#input__email_verification_pin, #captcha-internal'
+)
+
+# People search: LinkedIn's own JSON search endpoint, with the results page as fallback
+SEARCH_API_URL = "https://www.linkedin.com/voyager/api/search/blended"
+SEARCH_PAGE_SIZE = 10
+# Returns hrefs of profile links not returned by a previous call, marking them as read
+NEW_PROFILE_LINKS_JS = """
+const links = Array.from(document.querySelectorAll('a[href*="/in/"]:not([data-scraper-read])'));
+links.forEach(a => a.setAttribute('data-scraper-read', ''));
+return links.map(a => a.href);
+"""
+
+
+def to_json_bytes(obj, indent: bool = False) -> bytes:
+    """Serialize to UTF-8 JSON with orjson when installed, else the json module."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(obj, indent=2 if indent else None, ensure_ascii=False).encode('utf-8')
+
+
+class RateLimiter:
+    """Token bucket allowing one request per `interval` seconds on average, with bursts of up to `burst`."""
+    
+    def __init__(self, interval: float, burst: int = 1):
+        self.interval = interval
+        self.burst = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+    
+    def acquire(self):
+        """Block until a request may be sent. Safe to call from multiple threads."""
+        with self.lock:
+            now = time.monotonic()
+            if self.interval > 0:
+                self.tokens = min(self.burst, self.tokens + (now - self.updated) / self.interval)
+            else:
+                self.tokens = self.burst
+            self.updated = now
+            
+            # Take a token; if the bucket is empty this reserves the next one to refill
+            self.tokens -= 1
+            wait = -self.tokens * self.interval if self.tokens < 0 else 0
+        
+        if wait > 0:
+            time.sleep(wait)
+
+
+class BrowserPool:
+    """
+    Logged-in Chrome drivers handed out to worker threads, one thread per driver at a time.
+    Drivers are created on demand (up to `size`) and given the scraper's session cookies,
+    so they never log in themselves. The scraper's own driver is not pooled: it stays
+    on the search results page.
+    """
+    
+    def __init__(self, scraper: "LinkedInScraper", size: int):
+        self.scraper = scraper
+        self.size = size
+        self.cookies = scraper.driver.get_cookies()
+        self.drivers = []
+        self.idle = queue.Queue()
+        self.lock = threading.Lock()
+    
+    def acquire(self):
+        """Take an idle driver, starting a new one if none is idle and the pool isn't full."""
+        try:
+            return self.idle.get_nowait()
+        except queue.Empty:
+            pass
+        
+        with self.lock:
+            can_create = len(self.drivers) < self.size
+            if can_create:
+                self.drivers.append(None)  # Reserve the slot while Chrome starts
+        if not can_create:
+            return self.wait_for_idle()
+        
+        try:
+            driver = self.scraper.create_driver(block_resources=True)
+            self.scraper.apply_cookies(driver, self.cookies)
+        except Exception as e:
+            print(f"   ⚠️  Could not start another browser: {e}")
+            with self.lock:
+                self.drivers.remove(None)
+            return self.wait_for_idle()
+        
+        with self.lock:
+            self.drivers[self.drivers.index(None)] = driver
+        return driver
+    
+    def wait_for_idle(self):
+        """Block until a driver is released; raise RuntimeError if the pool has none to give."""
+        while True:
+            try:
+                return self.idle.get(timeout=1)
+            except queue.Empty:
+                pass
+            # Empty means every start failed and none is still in progress, so nothing will be released
+            with self.lock:
+                if not self.drivers:
+                    raise RuntimeError("no browser could be started")
+    
+    def release(self, driver):
+        """Return a driver to the pool."""
+        self.idle.put(driver)
+    
+    def fetch(self, url: str) -> Optional[bytes]:
+        """Load a page in a pooled driver and return its rendered HTML, or None on failure."""
+        try:
+            driver = self.acquire()
+        except RuntimeError as e:
+            print(f"   ⚠️  Skipping {url}: {e}")
+            return None
+        
+        try:
+            driver.get(url)
+            self.scraper.wait_ready('section#experience, main', driver=driver)
+            self.scraper.polite_pause()
+            return driver.page_source.encode('utf-8')
+        except Exception as nav_error:
+            print(f"   ⚠️  Error navigating to {url}: {nav_error}")
+            return None
+        finally:
+            self.release(driver)
+    
+    def close(self):
+        """Quit every driver this pool started."""
+        for driver in self.drivers:
+            if driver is not None:
+                try:
+                    driver.quit()
+                except Exception:
+                    pass
+
+
+class PlaywrightPool:
+    """
+    Headless Playwright Chromium for profiles that need a real browser.
+    One browser and one context (holding the logged-in cookies) are shared by every
+    worker thread: fetches run as pages on a background asyncio loop, so up to
+    `concurrency` profiles load at once in a single process, without per-command
+    WebDriver round-trips. Same fetch()/close() interface as BrowserPool.
+    Like BrowserPool, nothing is launched until the first fetch; if Playwright can't
+    start then, fetches go to `fallback` instead.
+    """
+    
+    def __init__(self, cookies: List[Dict], concurrency: int, fallback: Optional[BrowserPool] = None):
+        self.cookies = cookies
+        self.concurrency = concurrency
+        self.fallback = fallback
+        self.playwright = None
+        self.browser = None
+        self.loop = None
+        self.failed = False
+        self.start_lock = threading.Lock()
+    
+    def ensure_started(self) -> bool:
+        """Launch Chromium on its event-loop thread if not yet running; False if it can't start."""
+        with self.start_lock:
+            if self.loop is None and not self.failed:
+                self.loop = asyncio.new_event_loop()
+                threading.Thread(target=self.loop.run_forever, daemon=True).start()
+                try:
+                    self.run(self.start(self.cookies))
+                    print("✅ Playwright browser ready for fallback profile fetches")
+                except Exception as e:
+                    print(f"⚠️  Could not start Playwright ({e}), using Selenium browsers instead")
+                    self.failed = True
+                    try:
+                        self.shutdown()
+                    except Exception:
+                        pass
+        return not self.failed
+    
+    def run(self, coro):
+        """Run a coroutine on the pool's event loop and wait for its result."""
+        return asyncio.run_coroutine_threadsafe(coro, self.loop).result()
+    
+    async def start(self, cookies: List[Dict]):
+        self.semaphore = asyncio.Semaphore(self.concurrency)
+        self.playwright = await async_playwright().start()
+        self.browser = await self.playwright.chromium.launch(headless=True)
+        self.context = await self.browser.new_context(user_agent=USER_AGENT)
+        
+        # Selenium cookie dicts -> Playwright's format
+        await self.context.add_cookies([
+            {
+                'name': cookie['name'],
+                'value': cookie['value'],
+                'domain': cookie['domain'],
+                'path': cookie.get('path', '/'),
+                'secure': cookie.get('secure', False),
+                'httpOnly': cookie.get('httpOnly', False),
+                **({'expires': cookie['expiry']} if 'expiry' in cookie else {}),
+                **({'sameSite': cookie['sameSite']} if cookie.get('sameSite') in ('Strict', 'Lax', 'None') else {}),
+            }
+            for cookie in cookies
+        ])
+        
+        # Only the DOM is read: skip images, stylesheets, fonts and media
+        await self.context.route('**/*', self.block_resources)
+    
+    async def block_resources(self, route):
+        if route.request.resource_type in ('image', 'stylesheet', 'font', 'media'):
+            await route.abort()
+        else:
+            await route.continue_()
+    
+    async def fetch_page(self, url: str) -> bytes:
+        async with self.semaphore:
+            page = await self.context.new_page()
+            try:
+                await page.goto(url, wait_until='domcontentloaded')
+                try:
+                    await page.wait_for_selector('section#experience, main', timeout=10_000)
+                except PlaywrightTimeoutError:
+                    pass  # Return whatever rendered
+                return (await page.content()).encode('utf-8')
+            finally:
+                await page.close()
+    
+    def fetch(self, url: str) -> Optional[bytes]:
+        """Load a page and return its rendered HTML, or None on failure. Safe to call from any thread."""
+        if not self.ensure_started():
+            return self.fallback.fetch(url) if self.fallback else None
+        try:
+            return self.run(self.fetch_page(url))
+        except Exception as nav_error:
+            print(f"   ⚠️  Error navigating to {url}: {nav_error}")
+            return None
+    
+    async def stop(self):
+        if self.browser:
+            await self.browser.close()
+        if self.playwright:
+            await self.playwright.stop()
+    
+    def shutdown(self):
+        """Close the browser, if any, and stop the background loop."""
+        if self.loop is None:
+            return
+        try:
+            self.run(self.stop())
+        finally:
+            self.loop.call_soon_threadsafe(self.loop.stop)
+            self.loop = None
+    
+    def close(self):
+        """Close the browser, stop the background loop, and close the fallback pool."""
+        with self.start_lock:
+            self.shutdown()
+        if self.fallback:
+            self.fallback.close()
+
 
 class LinkedInScraper:
     def __init__(self, email: Optional[str] = None, password: Optional[str] = None):
@@ -57,12 +378,37 @@ class LinkedInScraper:
         self.email = email or os.getenv("LINKEDIN_EMAIL")
         self.password = password or os.getenv("LINKEDIN_PASSWORD")
         self.driver = None
+        self.browser_pool = None
+        self.session = None
+        self.rate_limiter = RateLimiter(interval=5)
         self.alumni_data = []
+        self._all_companies = set()  # Union of every alumnus' (cleaned) Past Companies
+        self._seen_urls = set()  # Normalized URLs of the profiles in alumni_data
         
     def setup_driver(self):
         """Setup Chrome WebDriver."""
+        self.driver = self.create_driver()
+    
+    def create_driver(self, block_resources: bool = False):
+        """
+        Start a new Chrome WebDriver.
+        
+        Args:
+            block_resources: Don't load images or stylesheets. Only for browsers nobody
+                interacts with - login, 2FA and CAPTCHAs need the page to render normally.
+        """
         options = webdriver.ChromeOptions()
         
+        # Return from driver.get() at DOMContentLoaded instead of waiting for every
+        # image, font and tracker; callers wait for the elements they need
+        options.page_load_strategy = 'eager'
+        
+        prefs = {'profile.default_content_setting_values.notifications': 2}
+        if block_resources:
+            prefs['profile.managed_default_content_settings.images'] = 2
+            prefs['profile.managed_default_content_settings.stylesheets'] = 2
+        options.add_experimental_option('prefs', prefs)
+        
         # Headless mode is DISABLED to allow manual 2FA entry
         # Uncomment the line below if you need headless mode:
         # options.add_argument('--headless=new')
@@ -70,11 +416,19 @@ class LinkedInScraper:
         options.add_argument('--no-sandbox')
         options.add_argument('--disable-dev-shm-usage')
         options.add_argument('--disable-blink-features=AutomationControlled')
-        options.add_experimental_option("excludeSwitches", ["enable-automation"])
+        options.add_experimental_option("excludeSwitches", ["enable-automation", "enable-logging"])
         options.add_experimental_option('useAutomationExtension', False)
         
+        # Quiet, lean browser: no Chrome logging, extensions, GPU, sync, metrics or
+        # other background traffic competing with the pages we actually load
+        for arg in ('--log-level=3', '--disable-extensions', '--disable-gpu',
+                    '--disable-background-networking', '--disable-sync',
+                    '--metrics-recording-only', '--mute-audio', '--no-first-run',
+                    '--no-default-browser-check'):
+            options.add_argument(arg)
+        
         # Add user agent to avoid detection
-        options.add_argument('user-agent=Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')
+        options.add_argument(f'user-agent={USER_AGENT}')
         
         # Window size for better visibility
         options.add_argument('--window-size=1920,1080')
@@ -82,18 +436,19 @@ class LinkedInScraper:
         
         try:
             # Try using webdriver-manager first (auto-downloads correct ChromeDriver)
+            # ChromeDriver's own log goes nowhere
             if USE_WEBDRIVER_MANAGER:
-                from selenium.webdriver.chrome.service import Service
                 from webdriver_manager.chrome import ChromeDriverManager
                 print("🔧 Using webdriver-manager to setup ChromeDriver...")
-                service = Service(ChromeDriverManager().install())
-                self.driver = webdriver.Chrome(service=service, options=options)
+                service = Service(ChromeDriverManager().install(), log_output=os.devnull)
             else:
                 # Fallback to system ChromeDriver
-                self.driver = webdriver.Chrome(options=options)
+                service = Service(log_output=os.devnull)
+            driver = webdriver.Chrome(service=service, options=options)
             
-            self.driver.maximize_window()
+            driver.maximize_window()
             print("✅ Chrome driver initialized")
+            return driver
         except Exception as e:
             error_msg = str(e)
             print(f"❌ Error initializing Chrome driver: {error_msg}")
@@ -115,6 +470,116 @@ class LinkedInScraper:
             
             raise
     
+    def wait_ready(self, css: str, timeout: int = 10, driver=None) -> bool:
+        """
+        Wait until an element matching a CSS selector is present on the current page.
+        
+        Args:
+            css: CSS selector to wait for
+            timeout: Maximum seconds to wait
+            driver: Driver to wait on (defaults to the scraper's own driver)
+            
+        Returns:
+            True if the element appeared, False on timeout
+        """
+        try:
+            WebDriverWait(driver or self.driver, timeout).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, css))
+            )
+            return True
+        except TimeoutException:
+            return False
+    
+    def polite_pause(self):
+        """Short random pause between browser actions (politeness, not page loading)."""
+        time.sleep(random.uniform(0.2, 0.5))
+    
+    def apply_cookies(self, driver, cookies: List[Dict]):
+        """Load saved LinkedIn cookies into a driver."""
+        # Cookies can only be set for the domain the browser is currently on
+        driver.get("https://www.linkedin.com/")
+        for cookie in cookies:
+            cookie = {key: cookie[key] for key in ('name', 'value', 'domain', 'path', 'secure', 'httpOnly', 'expiry') if key in cookie}
+            try:
+                driver.add_cookie(cookie)
+            except Exception:
+                continue  # Skip cookies Chrome rejects
+    
+    def save_cookies(self):
+        """Save the logged-in session's cookies so later runs can skip login."""
+        os.makedirs(os.path.dirname(COOKIES_FILE), exist_ok=True)
+        with open(COOKIES_FILE, 'w', encoding='utf-8') as f:
+            json.dump(self.driver.get_cookies(), f)
+        print(f"💾 Session cookies saved to {COOKIES_FILE}")
+    
+    def restore_login(self) -> bool:
+        """
+        Log in with cookies saved by a previous run.
+        
+        Returns:
+            True if the saved session is still valid, False otherwise
+        """
+        if not os.path.exists(COOKIES_FILE):
+            return False
+        
+        try:
+            with open(COOKIES_FILE, 'r', encoding='utf-8') as f:
+                cookies = json.load(f)
+            self.apply_cookies(self.driver, cookies)
+            self.driver.get("https://www.linkedin.com/feed/")
+            self.wait_ready('main')
+        except Exception as e:
+            print(f"⚠️  Could not restore saved session: {e}")
+            return False
+        
+        if "feed" in self.driver.current_url:
+            print("✅ Restored saved LinkedIn session (skipping login)")
+            return True
+        
+        print("⚠️  Saved session expired, logging in again")
+        self.driver.delete_all_cookies()
+        return False
+    
+    def create_browser_pool(self):
+        """Set up profile fallback fetches: Playwright if installed, else Selenium. Browsers start on first use."""
+        browser_pool = BrowserPool(self, BROWSER_POOL_SIZE)
+        if async_playwright is not None:
+            return PlaywrightPool(browser_pool.cookies, PROFILE_WORKERS, fallback=browser_pool)
+        return browser_pool
+    
+    def setup_session(self):
+        """Create an HTTP session that reuses the logged-in browser's cookies (li_at, JSESSIONID)."""
+        self.session = requests.Session()
+        self.session.headers.update({
+            'User-Agent': USER_AGENT,
+            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+            'Accept-Language': 'en-US,en;q=0.9',
+            'Connection': 'keep-alive',
+        })
+        
+        # Reuse TCP/TLS connections across all profile fetches; retry transient failures
+        adapter = HTTPAdapter(
+            pool_connections=HTTP_POOL_CONNECTIONS,
+            pool_maxsize=HTTP_POOL_MAXSIZE,
+            max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504])
+        )
+        self.session.mount('https://', adapter)
+        
+        for cookie in self.driver.get_cookies():
+            self.session.cookies.set(
+                cookie['name'],
+                cookie['value'],
+                domain=cookie.get('domain'),
+                path=cookie.get('path', '/')
+            )
+        
+        # LinkedIn expects the JSESSIONID value (without quotes) as the CSRF token
+        csrf_token = self.session.cookies.get('JSESSIONID', domain='.www.linkedin.com') or self.session.cookies.get('JSESSIONID')
+        if csrf_token:
+            self.session.headers['csrf-token'] = csrf_token.strip('"')
+        
+        print("✅ HTTP session initialized from browser cookies")
+    
     def login(self):
         """Login to LinkedIn with 2FA support."""
         if not self.email or not self.password:
@@ -125,8 +590,8 @@ class LinkedInScraper:
         
         try:
             print("🔐 Logging into LinkedIn...")
-            self.driver.get("https://www.linkedin.com/login")
-            time.sleep(2)
+            login_url = "https://www.linkedin.com/login"
+            self.driver.get(login_url)
             
             # Enter email
             email_field = WebDriverWait(self.driver, 10).until(
@@ -142,21 +607,16 @@ class LinkedInScraper:
             login_button = self.driver.find_element(By.XPATH, "//button[@type='submit']")
             login_button.click()
             
-            # Wait a bit for page to load
-            time.sleep(3)
-            
-            # Check for 2FA challenge
-            current_url = self.driver.current_url
-            page_source = self.driver.page_source.lower()
+            # Wait for LinkedIn to navigate away from the login form
+            try:
+                WebDriverWait(self.driver, 10).until(EC.url_changes(login_url))
+            except TimeoutException:
+                pass  # Still on the login page - handled below
             
             # Check if we're on a 2FA/challenge page
             is_2fa_page = (
-                "challenge" in current_url.lower() or
-                "two-step" in page_source or
-                "verification" in page_source or
-                "security" in current_url.lower() or
-                "enter the code" in page_source or
-                "verify your identity" in page_source
+                bool(CHALLENGE_URL_RE.search(self.driver.current_url)) or
+                bool(self.driver.find_elements(By.CSS_SELECTOR, CHALLENGE_INPUT_SELECTOR))
             )
             
             if is_2fa_page:
@@ -178,21 +638,11 @@ class LinkedInScraper:
                     time.sleep(check_interval)
                     waited += check_interval
                     
-                    current_url = self.driver.current_url
-                    # Check if we've successfully logged in
-                    if "feed" in current_url or "mynetwork" in current_url or "linkedin.com/in/" in current_url:
+                    # One URL read per tick; check if we've successfully logged in
+                    if LOGGED_IN_URL_RE.search(self.driver.current_url):
                         print("✅ Successfully logged in after verification!")
                         return True
                     
-                    # Still on challenge page, continue waiting
-                    if "challenge" not in current_url.lower() and "security" not in current_url.lower():
-                        # Might have moved to a different page, check again
-                        time.sleep(2)
-                        current_url = self.driver.current_url
-                        if "feed" in current_url or "mynetwork" in current_url:
-                            print("✅ Successfully logged in!")
-                            return True
-                    
                     # Show progress every 30 seconds
                     if waited % 30 == 0:
                         remaining = (max_wait_time - waited) // 60
@@ -202,7 +652,12 @@ class LinkedInScraper:
                 return False
             
             # Check if login was successful (no 2FA needed)
-            time.sleep(2)
+            try:
+                WebDriverWait(self.driver, 10).until(
+                    lambda driver: "feed" in driver.current_url or "mynetwork" in driver.current_url
+                )
+            except TimeoutException:
+                pass  # Handled below
             current_url = self.driver.current_url
             if "feed" in current_url or "mynetwork" in current_url:
                 print("✅ Successfully logged in")
@@ -234,6 +689,8 @@ class LinkedInScraper:
         Generator that yields new profile URLs page-by-page.
         As soon as a page worth of profiles is discovered, it yields them so the caller
         can begin scraping immediately (no waiting for many pages).
+        Uses LinkedIn's JSON search API, falling back to scrolling the results page
+        in the browser if the API returns nothing.
         
         Args:
             max_results: Maximum number of profile URLs to yield
@@ -244,12 +701,102 @@ class LinkedInScraper:
         """
         print(f"🔍 Searching for BITSoM MBA alumni (target: {max_results} results)...")
         
+        found_any = False
+        for page_number, page_urls in self.iter_search_alumni_api(max_results, max_pages):
+            found_any = True
+            yield page_number, page_urls
+        
+        if not found_any:
+            print("   ↪️  Search API returned no profiles, falling back to browser search")
+            yield from self.iter_search_alumni_browser(max_results, max_pages)
+    
+    def iter_search_alumni_api(self, max_results: int = 250, max_pages: int = 50):
+        """
+        Yield new profile URLs page-by-page from the Voyager search API.
+        One small JSON request per page of results, no rendering or scrolling.
+        
+        Args:
+            max_results: Maximum number of profile URLs to yield
+            max_pages: Maximum number of result pages to request
+        
+        Yields:
+            Tuple (page_number, List[str]) containing new profile URLs found on that page
+        """
+        headers = {
+            'Accept': 'application/vnd.linkedin.normalized+json+2.1',
+            'x-li-lang': 'en_US',
+            'x-restli-protocol-version': '2.0.0',
+        }
+        all_seen_urls = set()
+        total_found = 0
+        
+        for page_number in range(1, (max_pages or 50) + 1):
+            params = {
+                'keywords': 'BITSoM MBA',
+                'origin': 'GLOBAL_SEARCH_HEADER',
+                'q': 'all',
+                'filters': 'List(resultType->PEOPLE)',
+                'count': SEARCH_PAGE_SIZE,
+                'start': (page_number - 1) * SEARCH_PAGE_SIZE,
+            }
+            
+            self.rate_limiter.acquire()
+            try:
+                response = self.session.get(SEARCH_API_URL, params=params, headers=headers, timeout=10)
+                response.raise_for_status()
+                data = response.json()
+            except (requests.RequestException, ValueError) as e:
+                print(f"   ⚠️  Search API request failed on page {page_number}: {e}")
+                return
+            
+            # Profiles appear as entities with a publicIdentifier (the /in/<id>/ slug)
+            page_urls = []
+            identifiers = [item.get('publicIdentifier') for item in data.get('included', [])]
+            if not any(identifiers):
+                break  # Past the last page of results
+            
+            for identifier in identifiers:
+                if not identifier or identifier == 'UNKNOWN':
+                    continue
+                full_url = self.normalize_url(f"https://www.linkedin.com/in/{identifier}/")
+                if full_url not in all_seen_urls:
+                    all_seen_urls.add(full_url)
+                    page_urls.append(full_url)
+                    total_found += 1
+                    if total_found >= max_results:
+                        break
+            
+            if page_urls:
+                print(f"   📄 Page {page_number}: found {len(page_urls)} new profiles via API (total {total_found})")
+                yield page_number, page_urls
+            else:
+                print(f"   📄 Page {page_number}: no new (unique) profiles")
+            
+            if total_found >= max_results:
+                break
+        
+        if total_found > 0:
+            print(f"✅ Found {total_found} unique profile URLs via search API")
+    
+    def iter_search_alumni_browser(self, max_results: int = 250, max_pages: int = 50):
+        """
+        Yield new profile URLs page-by-page by scrolling the search results page in the browser.
+        
+        Args:
+            max_results: Maximum number of profile URLs to yield
+            max_pages: Maximum number of search result pages to visit
+        
+        Yields:
+            Tuple (page_number, List[str]) containing new profile URLs found on that page
+        """        
         # LinkedIn search URL for BITSoM MBA
         search_url = "https://www.linkedin.com/search/results/people/?keywords=BITSoM%20MBA&origin=GLOBAL_SEARCH_HEADER"
         
         try:
             self.driver.get(search_url)
-            time.sleep(5)  # Wait longer for page to load
+            if not self.wait_ready('main a[href*="/in/"]', timeout=15):
+                print("   ⚠️  Search results did not appear within 15s, continuing anyway")
+            self.polite_pause()
             
             all_seen_urls = set()
             scroll_pause = 3  # Increased pause
@@ -276,33 +823,24 @@ class LinkedInScraper:
                 self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
                 time.sleep(scroll_pause)
                 
-                # Get all profile links from current page
-                soup = BeautifulSoup(self.driver.page_source, 'html.parser')
-                links = soup.find_all('a', href=True)
+                # Read only the profile links added since the last scroll, in one
+                # browser round-trip (no full page_source download and re-parse).
+                # Re-rendered links come back unmarked; duplicates are skipped below.
+                hrefs = self.driver.execute_script(NEW_PROFILE_LINKS_JS)
                 
                 page_urls = []
-                for link in links:
-                    href = link.get('href', '')
-                    # More specific check for profile links
-                    if '/in/' in href and 'search' not in href and 'miniProfile' not in href:
-                        # Clean and normalize the URL
-                        if href.startswith('/'):
-                            full_url = f"https://www.linkedin.com{href.split('?')[0]}"  # Remove query params
-                        elif href.startswith('http'):
-                            full_url = href.split('?')[0]  # Remove query params
-                        else:
-                            continue
-                        
-                        # Normalize URL (remove trailing slash)
-                        full_url = self.normalize_url(full_url)
-                        
-                        # Only add if it's a valid profile URL and not already collected
-                        if full_url and '/in/' in full_url and full_url not in all_seen_urls:
-                            all_seen_urls.add(full_url)
-                            page_urls.append(full_url)
-                            total_found += 1
-                            if total_found >= max_results:
-                                break
+                for href in hrefs:
+                    # Canonical profile URL, so tracking params and sub-page links
+                    # don't make one person look like several ("" if not a profile)
+                    full_url = self.normalize_url(href)
+                    
+                    # Only add if it's a valid profile URL and not already collected
+                    if full_url and full_url not in all_seen_urls:
+                        all_seen_urls.add(full_url)
+                        page_urls.append(full_url)
+                        total_found += 1
+                        if total_found >= max_results:
+                            break
                 if total_found >= max_results:
                     pass  # fall through to processing below
                 
@@ -440,6 +978,156 @@ class LinkedInScraper:
             traceback.print_exc()
             return []
     
+    def fetch_profile_html(self, profile_url: str) -> Optional[bytes]:
+        """
+        Fetch a profile's HTML over HTTP with the logged-in session.
+        Falls back to loading the page in the browser when LinkedIn doesn't serve
+        the profile to a plain HTTP client (auth wall, block status, no name heading).
+        
+        Args:
+            profile_url: LinkedIn profile URL
+            
+        Returns:
+            Page HTML as bytes, or None if the page could not be loaded
+        """
+        self.rate_limiter.acquire()
+        
+        try:
+            response = self.session.get(profile_url, timeout=10)
+            if response.status_code == 200 and 'authwall' not in response.url and b'<h1' in response.content:
+                return response.content
+            print(f"   ↪️  HTTP fetch not usable (status {response.status_code}), loading in browser")
+        except requests.RequestException as http_error:
+            print(f"   ⚠️  HTTP fetch failed for {profile_url}: {http_error}, loading in browser")
+        
+        return self.browser_pool.fetch(profile_url)
+    
+    def parse_profile_regex(self, page_html: bytes) -> Tuple[Optional[str], List[str]]:
+        """
+        Fast path: pull the name and companies straight out of the raw HTML bytes.
+        Same preference as parse_profile_soup - the name from the first heading class
+        in NAME_HEADING_CLASSES that matches, else any <h1>; company links and
+        company-like spans in the experience section, else company links anywhere on the page.
+        
+        Args:
+            page_html: Raw profile HTML
+            
+        Returns:
+            (name, companies); name is None and/or companies is empty if the patterns don't match
+        """
+        def decode(raw: bytes) -> str:
+            return ' '.join(unescape(raw.decode('utf-8', 'replace')).split())
+        
+        name = None
+        for name_re in NAME_RES:
+            name_match = name_re.search(page_html)
+            if name_match:
+                name = decode(name_match.group(1)) or None
+                if name:
+                    break
+        
+        companies = []
+        seen = set()
+        section_match = EXPERIENCE_SECTION_RE.search(page_html)
+        if section_match:
+            end = page_html.find(b'</section>', section_match.end())
+            section_html = page_html[section_match.start():end if end != -1 else len(page_html)]
+            for match in EXPERIENCE_COMPANY_RE.finditer(section_html):
+                text = decode(match.group(2))
+                if match.group(1):  # A span: must look like a company name, not a date
+                    if len(text) <= 2 or COMPANY_BLACKLIST_RE.search(text):
+                        continue
+                if text and text not in seen:
+                    seen.add(text)
+                    companies.append(text)
+        
+        if not companies:
+            for match in COMPANY_LINK_RE.finditer(page_html):
+                text = decode(match.group(1))
+                if text and text not in seen:
+                    seen.add(text)
+                    companies.append(text)
+        
+        return name, companies
+    
+    def parse_profile_soup(self, page_html: bytes, profile_url: str) -> Optional[Tuple[str, List[str]]]:
+        """
+        Extract the name and companies from profile HTML with BeautifulSoup.
+        
+        Args:
+            page_html: Raw profile HTML
+            profile_url: LinkedIn profile URL (for error messages)
+            
+        Returns:
+            (name, companies), or None if the page could not be parsed
+        """
+        # Parse page with error handling
+        try:
+            soup = BeautifulSoup(page_html, 'lxml', parse_only=PROFILE_STRAINER)
+        except Exception as parse_error:
+            print(f"   ⚠️  Error parsing page for {profile_url}: {parse_error}")
+            return None
+        
+        # Extract name - try multiple selectors with error handling
+        name = "Unknown"
+        try:
+            name_selectors = [('h1', {'class': cls}) for cls in NAME_HEADING_CLASSES] + [('h1', {})]
+            for tag, attrs in name_selectors:
+                try:
+                    name_elem = soup.find(tag, attrs)
+                    if name_elem:
+                        name = name_elem.get_text(strip=True)
+                        if name and name != "Unknown":
+                            break
+                except Exception:
+                    continue  # Try next selector
+        except Exception as name_error:
+            print(f"   ⚠️  Error extracting name: {name_error}")
+            # Continue with "Unknown" name
+        
+        # Extract companies in one pass over links and spans. Company links and
+        # company-like spans in the experience section are preferred; company
+        # links anywhere on the page are the fallback.
+        section_companies = []
+        page_companies = []
+        section_seen = set()
+        page_seen = set()
+        
+        try:
+            experience_section = soup.find('section', {'id': 'experience'})
+            for tag in soup.find_all(['a', 'span']):
+                try:
+                    text = tag.get_text(strip=True)
+                    if not text or len(text) >= 100:
+                        continue
+                    
+                    if tag.name == 'a':
+                        if '/company/' not in tag.get('href', ''):
+                            continue
+                        if text not in page_seen:
+                            page_seen.add(text)
+                            page_companies.append(text)
+                    elif not (len(text) > 2 and any('t-14' in c or 't-16' in c for c in tag.get('class', []))):
+                        continue
+                    # Check if it looks like a company name (not dates, locations, etc.)
+                    elif COMPANY_BLACKLIST_RE.search(text):
+                        continue
+                    
+                    in_experience = experience_section is not None and any(
+                        parent is experience_section for parent in tag.parents
+                    )
+                    if in_experience and text not in section_seen:
+                        section_seen.add(text)
+                        section_companies.append(text)
+                except Exception:
+                    continue  # Skip this element if error
+                    
+        except Exception as company_error:
+            print(f"   ⚠️  Error extracting companies: {company_error}")
+            # Continue with what was collected so far
+        
+        return name, section_companies or page_companies
+    
     def extract_profile_data(self, profile_url: str) -> Optional[Dict]:
         """
         Extract data from a LinkedIn profile.
@@ -451,118 +1139,18 @@ class LinkedInScraper:
             Dictionary with profile data or None if failed
         """
         try:
-            # Navigate to profile with error handling
-            try:
-                self.driver.get(profile_url)
-                time.sleep(3)  # Be respectful with delays
-            except Exception as nav_error:
-                print(f"   ⚠️  Error navigating to {profile_url}: {nav_error}")
+            # Fetch profile over HTTP (browser only as a fallback)
+            page_html = self.fetch_profile_html(profile_url)
+            if page_html is None:
                 return None
             
-            # Parse page with error handling
-            try:
-                soup = BeautifulSoup(self.driver.page_source, 'html.parser')
-            except Exception as parse_error:
-                print(f"   ⚠️  Error parsing page for {profile_url}: {parse_error}")
-                return None
-            
-            # Extract name - try multiple selectors with error handling
-            name = "Unknown"
-            try:
-                name_selectors = [
-                    ('h1', {'class': 'text-heading-xlarge'}),
-                    ('h1', {'class': 'top-card-layout__title'}),
-                    ('h1', {'class': 'pv-text-details__left-panel'}),
-                    ('h1', {}),
-                ]
-                for tag, attrs in name_selectors:
-                    try:
-                        name_elem = soup.find(tag, attrs)
-                        if name_elem:
-                            name = name_elem.get_text(strip=True)
-                            if name and name != "Unknown":
-                                break
-                    except Exception:
-                        continue  # Try next selector
-            except Exception as name_error:
-                print(f"   ⚠️  Error extracting name: {name_error}")
-                # Continue with "Unknown" name
-            
-            # Extract companies from experience section with error handling
-            companies = []
-            
-            try:
-                # Method 1: Look for experience section
-                experience_section = soup.find('section', {'id': 'experience'})
-                if experience_section:
-                    try:
-                        # Try to find company names in various structures
-                        company_links = experience_section.find_all('a', href=lambda x: x and '/company/' in x)
-                        for link in company_links:
-                            try:
-                                company_name = link.get_text(strip=True)
-                                if company_name and company_name not in companies:
-                                    companies.append(company_name)
-                            except Exception:
-                                continue  # Skip this link if error
-                        
-                        # Also try span elements with company names
-                        spans = experience_section.find_all('span', class_=lambda x: x and ('t-14' in x or 't-16' in x))
-                        for span in spans:
-                            try:
-                                text = span.get_text(strip=True)
-                                # Filter out common non-company text
-                                if text and len(text) > 2 and len(text) < 100:
-                                    # Check if it looks like a company name (not dates, locations, etc.)
-                                    if not any(word in text.lower() for word in ['present', 'full-time', 'part-time', 'intern', 'month', 'year', 'jan', 'feb', 'mar']):
-                                        if text not in companies:
-                                            companies.append(text)
-                            except Exception:
-                                continue  # Skip this span if error
-                    except Exception as exp_error:
-                        print(f"   ⚠️  Error parsing experience section: {exp_error}")
-                        # Continue to other methods
-                
-                # Method 2: Look for experience items in the page
-                if not companies:
-                    try:
-                        # Try finding experience items by class
-                        exp_items = soup.find_all('div', class_=lambda x: x and ('pvs-list' in str(x) or 'experience' in str(x).lower()))
-                        for item in exp_items:
-                            try:
-                                # Look for links that might be companies
-                                links = item.find_all('a', href=lambda x: x and '/company/' in x)
-                                for link in links:
-                                    try:
-                                        company_name = link.get_text(strip=True)
-                                        if company_name and company_name not in companies:
-                                            companies.append(company_name)
-                                    except Exception:
-                                        continue  # Skip this link
-                            except Exception:
-                                continue  # Skip this item
-                    except Exception as exp2_error:
-                        print(f"   ⚠️  Error in method 2: {exp2_error}")
-                        # Continue to method 3
-                
-                # Method 3: Search for company links anywhere on the page
-                if not companies:
-                    try:
-                        all_company_links = soup.find_all('a', href=lambda x: x and '/company/' in x)
-                        for link in all_company_links:
-                            try:
-                                company_name = link.get_text(strip=True)
-                                if company_name and company_name not in companies and len(company_name) < 100:
-                                    companies.append(company_name)
-                            except Exception:
-                                continue  # Skip this link
-                    except Exception as exp3_error:
-                        print(f"   ⚠️  Error in method 3: {exp3_error}")
-                        # Continue anyway, return empty companies list
-                        
-            except Exception as company_error:
-                print(f"   ⚠️  Error extracting companies: {company_error}")
-                # Continue with empty companies list
+            # Fast path: regex over the raw bytes; BeautifulSoup only if it finds nothing
+            name, companies = self.parse_profile_regex(page_html)
+            if name is None or not companies:
+                parsed = self.parse_profile_soup(page_html, profile_url)
+                if parsed is None:
+                    return None
+                name, companies = parsed
             
             # Clean and filter companies
             cleaned_companies = self.clean_companies_list(companies) if companies else []
@@ -602,52 +1190,75 @@ class LinkedInScraper:
     def normalize_url(self, url: str) -> str:
         """
         Normalize a LinkedIn URL for consistent comparison.
-        Removes query parameters and trailing slashes.
+        The same person is linked as /in/<slug>/ with tracking query strings
+        (?miniProfileUrn=...), fragments, sub-pages and country subdomains; all of
+        these map to https://www.linkedin.com/in/<slug>.
         
         Args:
             url: LinkedIn profile URL
             
         Returns:
-            Normalized URL
+            Normalized URL, or "" if it isn't a profile URL
         """
         if not url:
             return ""
-        # Remove query parameters
-        url = url.split('?')[0]
-        # Remove trailing slash
-        url = url.rstrip('/')
-        return url
+        match = PROFILE_PATH_RE.match(urlsplit(url).path)
+        if not match:
+            return ""
+        return f"https://www.linkedin.com/in/{match.group(1)}"
     
-    def load_existing_data(self, json_file: str = "data/bitcom_linkedin_alumni.json") -> set:
+    def load_existing_data(self, json_file: str = "data/bitcom_linkedin_alumni.json",
+                           progress_file: str = PROGRESS_FILE) -> set:
         """
-        Load existing scraped data and return set of already scraped URLs.
+        Load previously scraped profiles into memory and return the set of their URLs.
+        Reads the JSON summary from the last completed run plus the JSONL progress log,
+        which also holds profiles from runs that crashed before writing the summary.
         URLs are normalized for consistent comparison.
         
         Args:
             json_file: Path to existing JSON file
+            progress_file: Path to the JSONL progress log
             
         Returns:
             Set of normalized LinkedIn URLs that have already been scraped
         """
-        scraped_urls = set()
+        existing_alumni = []
         
         if os.path.exists(json_file):
             try:
                 with open(json_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    alumni_list = data.get('alumni', [])
-                    for alumni in alumni_list:
-                        url = alumni.get('LinkedIn URL', '')
-                        if url:
-                            normalized_url = self.normalize_url(url)
-                            if normalized_url:
-                                scraped_urls.add(normalized_url)
-                    print(f"📂 Loaded {len(scraped_urls)} existing profiles from {json_file}")
+                    existing_alumni.extend(json.load(f).get('alumni', []))
             except Exception as e:
-                print(f"⚠️  Error loading existing data: {e}")
-                print("   Starting fresh...")
+                print(f"⚠️  Error loading existing data from {json_file}: {e}")
         
-        return scraped_urls
+        if os.path.exists(progress_file):
+            try:
+                with open(progress_file, 'r', encoding='utf-8') as f:
+                    for line in f:
+                        try:
+                            existing_alumni.append(json.loads(line))
+                        except ValueError:
+                            continue  # Line cut short by a crash
+            except Exception as e:
+                print(f"⚠️  Error loading existing data from {progress_file}: {e}")
+        
+        for alumni in existing_alumni:
+            normalized_url = self.normalize_url(alumni.get('LinkedIn URL', ''))
+            if not normalized_url or normalized_url in self._seen_urls:
+                continue  # Profiles in both files (or logged twice) are kept once
+            self._seen_urls.add(normalized_url)
+            
+            cleaned_companies = self.clean_companies_list(alumni.get('Past Companies', []))
+            self.alumni_data.append({
+                'Name': alumni.get('Name', 'Unknown'),
+                'LinkedIn URL': alumni.get('LinkedIn URL', ''),
+                'Past Companies': cleaned_companies
+            })
+            self._all_companies.update(cleaned_companies)
+        
+        if self._seen_urls:
+            print(f"📂 Loaded {len(self._seen_urls)} existing profiles into memory")
+        return self._seen_urls
     
     def scrape_alumni(self, max_profiles: int = 20, delay: int = 5, exclude_existing: bool = True):
         """
@@ -655,46 +1266,41 @@ class LinkedInScraper:
         
         Args:
             max_profiles: Maximum number of NEW profiles to scrape (excluding already scraped)
-            delay: Delay between requests (seconds)
-            exclude_existing: If True, exclude profiles already in the JSON file
+            delay: Average delay between profile requests (seconds), enforced by a token bucket
+            exclude_existing: If True, exclude profiles already in the JSON file or progress log
         """
         print(f"\n{'='*60}")
         print("BITSoM LinkedIn Alumni Scraper")
         print(f"{'='*60}\n")
         
-        # Load existing data if excluding
-        existing_urls = set()
-        if exclude_existing:
-            existing_urls = self.load_existing_data()
-            if existing_urls:
-                # Load existing alumni data into self.alumni_data
-                json_file = "data/bitcom_linkedin_alumni.json"
-                if os.path.exists(json_file):
-                    try:
-                        with open(json_file, 'r', encoding='utf-8') as f:
-                            data = json.load(f)
-                            existing_alumni = data.get('alumni', [])
-                            # Clean existing data
-                            for alumni in existing_alumni:
-                                cleaned_companies = self.clean_companies_list(alumni.get('Past Companies', []))
-                                self.alumni_data.append({
-                                    'Name': alumni.get('Name', 'Unknown'),
-                                    'LinkedIn URL': alumni.get('LinkedIn URL', ''),
-                                    'Past Companies': cleaned_companies
-                                })
-                            print(f"📂 Loaded {len(existing_alumni)} existing profiles into memory")
-                    except Exception as e:
-                        print(f"⚠️  Error loading existing alumni data: {e}")
+        # Load existing data (including profiles logged by an interrupted run) if excluding
+        existing_urls = self.load_existing_data() if exclude_existing else set()
         
+        progress_log = None
         try:
             # Setup and login
             self.setup_driver()
-            if not self.login():
-                print("❌ Cannot proceed without login")
-                return
+            if not self.restore_login():
+                if not self.login():
+                    print("❌ Cannot proceed without login")
+                    return
+                self.save_cookies()
+            self.setup_session()
+            self.browser_pool = self.create_browser_pool()
+            self.rate_limiter = RateLimiter(interval=delay, burst=PROFILE_WORKERS)
+            
+            # Append-only progress log: each profile is written once, as soon as it's
+            # scraped; the full JSON summary is only written at the end
+            os.makedirs(os.path.dirname(PROGRESS_FILE), exist_ok=True)
+            progress_log = open(PROGRESS_FILE, 'ab+')
+            # A crash can leave a half-written last line: start on a fresh one
+            if progress_log.seek(0, os.SEEK_END):
+                progress_log.seek(-1, os.SEEK_END)
+                if progress_log.read(1) != b'\n':
+                    progress_log.write(b'\n')
             
             print(f"🔍 Starting incremental search + scrape (target: {max_profiles} new profiles)")
-            processed_urls = set(existing_urls) if exclude_existing else set()
+            processed_urls = set()
             initial_alumni_count = len(self.alumni_data)
             new_profiles_added = 0
             failed_count = 0
@@ -714,7 +1320,7 @@ class LinkedInScraper:
                         continue
                     
                     if normalized in processed_urls:
-                        continue  # Already processed in this session or existing JSON
+                        continue  # Already seen earlier in this session
                     
                     processed_urls.add(normalized)
                     
@@ -725,7 +1331,7 @@ class LinkedInScraper:
                     urls_to_scrape.append(url)
                 
                 if skipped_existing:
-                    print(f"   🔁 Page {page_number}: skipped {skipped_existing} profiles already in JSON")
+                    print(f"   🔁 Page {page_number}: skipped {skipped_existing} profiles already scraped")
                 
                 if not urls_to_scrape:
                     print(f"   📄 Page {page_number}: all profiles already known. Moving on...")
@@ -733,54 +1339,57 @@ class LinkedInScraper:
                 
                 print(f"   🚀 Page {page_number}: scraping {len(urls_to_scrape)} new profiles (target remaining: {max(0, max_profiles - new_profiles_added)})")
                 
-                for idx, url in enumerate(urls_to_scrape, 1):
-                    if new_profiles_added >= max_profiles:
-                        break
-                    
-                    try:
-                        print(f"  [Page {page_number} | {idx}/{len(urls_to_scrape)}] Processing: {url}")
-                        
-                        # Wrap extract_profile_data in try-except to catch any errors
+                # Fetch the page's profiles concurrently; results are handled here in
+                # order, so only this thread touches alumni_data and the progress file
+                urls_to_scrape = urls_to_scrape[:max_profiles - new_profiles_added]
+                with ThreadPoolExecutor(max_workers=PROFILE_WORKERS) as executor:
+                    futures = [executor.submit(self.extract_profile_data, url) for url in urls_to_scrape]
+                    for idx, (url, future) in enumerate(zip(urls_to_scrape, futures), 1):
                         try:
-                            data = self.extract_profile_data(url)
-                            if data:
-                                self.alumni_data.append(data)
-                                new_profiles_added = len(self.alumni_data) - initial_alumni_count
-                                print(f"      ✅ Extracted: {data.get('Name', 'Unknown')} - {len(data.get('Past Companies', []))} companies")
-                                
-                                # Save progress after EVERY profile
-                                try:
-                                    self.save_progress(is_error=False)
-                                    print(f"      💾 Saved to JSON ({len(self.alumni_data)} total profiles)")
-                                except Exception as save_error:
-                                    print(f"      ⚠️  Error saving progress: {save_error}")
-                                    # Continue anyway, don't stop the scraping
-                            else:
-                                print(f"      ⚠️  Failed to extract data (returned None)")
+                            print(f"  [Page {page_number} | {idx}/{len(urls_to_scrape)}] Processed: {url}")
+                            
+                            # Wrap extract_profile_data in try-except to catch any errors
+                            try:
+                                data = future.result()
+                                if data:
+                                    self.alumni_data.append(data)
+                                    self._seen_urls.add(self.normalize_url(url))
+                                    self._all_companies.update(data.get('Past Companies', []))
+                                    new_profiles_added = len(self.alumni_data) - initial_alumni_count
+                                    print(f"      ✅ Extracted: {data.get('Name', 'Unknown')} - {len(data.get('Past Companies', []))} companies")
+                                    
+                                    # Log progress after EVERY profile
+                                    try:
+                                        progress_log.write(to_json_bytes(data) + b'\n')
+                                        progress_log.flush()
+                                    except Exception as save_error:
+                                        print(f"      ⚠️  Error saving progress: {save_error}")
+                                        # Continue anyway, don't stop the scraping
+                                else:
+                                    print(f"      ⚠️  Failed to extract data (returned None)")
+                                    failed_count += 1
+                            except Exception as extract_error:
+                                # Catch errors from extract_profile_data itself
+                                print(f"      ❌ Error in extract_profile_data: {extract_error}")
+                                print(f"      Error type: {type(extract_error).__name__}")
                                 failed_count += 1
-                        except Exception as extract_error:
-                            # Catch errors from extract_profile_data itself
-                            print(f"      ❌ Error in extract_profile_data: {extract_error}")
-                            print(f"      Error type: {type(extract_error).__name__}")
+                                # Continue to next profile
+                            
+                        except KeyboardInterrupt:
+                            print("\n\n⚠️  Interrupted by user (Ctrl+C)")
+                            executor.shutdown(wait=False, cancel_futures=True)
+                            raise
+                        except Exception as e:
+                            # Catch any other unexpected errors
+                            print(f"      ❌ Unexpected error processing {url}: {e}")
+                            print(f"      Error type: {type(e).__name__}")
+                            import traceback
+                            print(f"      Traceback:")
+                            traceback.print_exc()
+                            print(f"      Continuing with next profile...")
                             failed_count += 1
-                            # Continue to next profile
-                        
-                        time.sleep(delay)  # Be respectful with rate limiting
-                        
-                    except KeyboardInterrupt:
-                        print("\n\n⚠️  Interrupted by user (Ctrl+C)")
-                        raise
-                    except Exception as e:
-                        # Catch any other unexpected errors
-                        print(f"      ❌ Unexpected error processing {url}: {e}")
-                        print(f"      Error type: {type(e).__name__}")
-                        import traceback
-                        print(f"      Traceback:")
-                        traceback.print_exc()
-                        print(f"      Continuing with next profile...")
-                        failed_count += 1
-                        # Continue to next profile instead of stopping
-                        continue
+                            # Continue to next profile instead of stopping
+                            continue
                 
                 if new_profiles_added >= max_profiles:
                     print(f"🎯 Reached target of {max_profiles} new profiles. Stopping search.")
@@ -822,6 +1431,10 @@ class LinkedInScraper:
             
             raise
         
+        finally:
+            if progress_log:
+                progress_log.close()
+        
     def filter_company_name(self, company: str) -> bool:
         """
         Filter out invalid company names.
@@ -866,22 +1479,21 @@ class LinkedInScraper:
             Cleaned and filtered list of company names
         """
         cleaned = []
+        seen = set()
         for company in companies:
             if self.filter_company_name(company):
                 # Clean up the company name (remove extra whitespace, etc.)
                 cleaned_name = ' '.join(company.split())
-                if cleaned_name not in cleaned:
+                if cleaned_name not in seen:
+                    seen.add(cleaned_name)
                     cleaned.append(cleaned_name)
         return cleaned
     
     def get_all_companies(self) -> List[str]:
         """Get a list of all unique companies (filtered)."""
-        all_companies = set()
-        for alumni in self.alumni_data:
-            companies = alumni.get('Past Companies', [])
-            cleaned = self.clean_companies_list(companies)
-            all_companies.update(cleaned)
-        return sorted(list(all_companies))
+        # alumni_data only ever holds cleaned company lists, and _all_companies is
+        # updated alongside every append, so there's nothing to recompute here
+        return sorted(self._all_companies)
     
     def save_progress(self, output_file: str = "bitcom_linkedin_alumni.json", is_error: bool = False):
         """
@@ -912,26 +1524,37 @@ class LinkedInScraper:
                 'Past Companies': cleaned_companies
             })
         
+        all_companies = self.get_all_companies()
         output_json = {
             'scraped_at': datetime.now().isoformat(),
             'total_profiles': len(self.alumni_data),
             'alumni': formatted_data,
-            'all_companies': self.get_all_companies(),
-            'companies_count': len(self.get_all_companies())
+            'all_companies': all_companies,
+            'companies_count': len(all_companies)
         }
         
         if is_error:
             output_json['status'] = 'partial_save_due_to_error'
         
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(output_json, f, indent=2, ensure_ascii=False)
+        with open(output_path, 'wb') as f:
+            f.write(to_json_bytes(output_json, indent=True))
         
         print(f"💾 Progress saved to {output_path}")
         return output_path
     
     def save_results(self, output_file: str = "bitcom_linkedin_alumni.json"):
-        """Save final results to JSON file."""
-        return self.save_progress(output_file, is_error=False)
+        """Save final results to JSON file, then set aside the progress log they now include."""
+        output_path = self.save_progress(output_file, is_error=False)
+        
+        # The log only has to survive runs that crash before this point; rotating it keeps
+        # it from growing every run and from bringing back profiles removed from the JSON
+        if os.path.exists(PROGRESS_FILE):
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            backup_path = f"{os.path.splitext(PROGRESS_FILE)[0]}_{timestamp}.jsonl"
+            os.replace(PROGRESS_FILE, backup_path)
+            print(f"🗂️  Progress log moved to {backup_path}")
+        
+        return output_path
     
     def save_companies_csv(self, output_file: str = "bitcom_companies.csv"):
         """Save companies list to CSV."""
@@ -939,16 +1562,17 @@ class LinkedInScraper:
         os.makedirs("data", exist_ok=True)
         
         companies = self.get_all_companies()
-        with open(output_path, 'w', newline='', encoding='utf-8') as f:
+        with open(output_path, 'w', newline='', encoding='utf-8', buffering=1 << 16) as f:
             writer = csv.writer(f)
             writer.writerow(['Company Name'])
-            for company in companies:
-                writer.writerow([company])
+            writer.writerows([company] for company in companies)
         
         print(f"💾 Companies list saved to {output_file}")
     
     def close(self):
         """Close the browser."""
+        if self.browser_pool:
+            self.browser_pool.close()
         if self.driver:
             self.driver.quit()
             print("✅ Browser closed")
@@ -962,7 +1586,7 @@ def main():
     except ImportError:
         print("❌ Selenium webdriver is not available.")
         print("   Please install required packages:")
-        print("   pip install selenium beautifulsoup4 pandas webdriver-manager")
+        print("   pip install selenium beautifulsoup4 requests lxml webdriver-manager")
         print("\n   webdriver-manager will automatically handle ChromeDriver installation.")
         print("   Or manually install ChromeDriver:")
         print("   - macOS: brew install chromedriver")
@@ -1001,13 +1625,14 @@ def main():
             print(f"\n{'='*60}")
             print("Summary")
             print(f"{'='*60}")
+            all_companies = scraper.get_all_companies()
             print(f"Total profiles scraped: {len(scraper.alumni_data)}")
-            print(f"Total unique companies: {len(scraper.get_all_companies())}")
+            print(f"Total unique companies: {len(all_companies)}")
             print(f"\nCompanies found:")
-            for company in scraper.get_all_companies()[:20]:  # Show first 20
+            for company in all_companies[:20]:  # Show first 20
                 print(f"  - {company}")
-            if len(scraper.get_all_companies()) > 20:
-                print(f"  ... and {len(scraper.get_all_companies()) - 20} more")
+            if len(all_companies) > 20:
+                print(f"  ... and {len(all_companies) - 20} more")
         else:
             print("❌ No data collected")
             
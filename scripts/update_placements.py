@@ -2,19 +2,32 @@
 """
 Update specific placement records in Pinecone 'placements' namespace.
 
-This script fetches records from Pinecone, updates metadata fields, and upserts them back.
+This script writes updated metadata fields to Pinecone (embeddings are left untouched).
+Records whose application_deadline changes are fetched first, so the deadline in
+their text can be rewritten; all other updates are sent without a fetch.
 
 Usage:
     1. Edit the UPDATES list below with the records you want to update
     2. python scripts/update_placements.py
+
+Requires: pip install "pinecone[grpc]" python-dotenv
+(without the grpc extra, the HTTP client is used instead)
 """
 
 import os
 import re
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone, timedelta
-from typing import Dict
+from functools import lru_cache
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List
 
-from pinecone import Pinecone
+# Data-plane calls go over gRPC (protobuf on multiplexed HTTP/2) when the grpc extra is installed
+try:
+    from pinecone.grpc import PineconeGRPC as Pinecone
+except ImportError:
+    from pinecone import Pinecone
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -22,10 +35,22 @@ load_dotenv()
 PINECONE_INDEX = "ipcs"
 PINECONE_NAMESPACE = os.getenv("PINECONE_NAMESPACE", "placements")
 PINECONE_API_KEY = os.getenv("PINECONE_API_KEY")
+FETCH_BATCH_SIZE = 100  # Max IDs per Pinecone fetch request
+PINECONE_POOL_THREADS = 30  # Concurrent fetch/update requests
+IST = timezone(timedelta(hours=5, minutes=30))  # Deadlines in UPDATES are given in IST
+UTC = timezone.utc
+EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+# Metadata fields UPDATES may set (those placement records carry and the app reads).
+# Anything else is almost certainly a typo, so it's rejected before any request is made.
+ALLOWED_FIELDS = {
+    "application_deadline", "text", "order", "chunk_type",
+    "source_url", "source_name", "source_description",
+}
+DEADLINE_RE = re.compile(r'Deadline: (\d{4}-\d{2}-\d{2})')  # Deadline line in a record's text
 
 if not PINECONE_API_KEY:
     raise ValueError("PINECONE_API_KEY not set")
-``
+
 pinecone_client = Pinecone(api_key=PINECONE_API_KEY)
 index = pinecone_client.Index(PINECONE_INDEX)
 
@@ -35,6 +60,23 @@ index = pinecone_client.Index(PINECONE_INDEX)
 # Format: {application_id: {metadata_field: new_value, ...}}
 # Note: For dates, use epoch milliseconds (timestamp * 1000)
 
+@lru_cache(maxsize=256)
+def _parse_to_epoch_ms(date_str: str, tz_offset_hours: int, tz_offset_minutes: int) -> int:
+    """Parse and convert one date string; cached, since UPDATES often repeats a deadline."""
+    # Parse the date string
+    dt = datetime.strptime(date_str, "%d-%b-%y %H:%M:%S")
+    # Create timezone offset (IST = UTC+5:30, built once at module level)
+    if (tz_offset_hours, tz_offset_minutes) == (5, 30):
+        tz_offset = IST
+    else:
+        tz_offset = timezone(timedelta(hours=tz_offset_hours, minutes=tz_offset_minutes))
+    dt = dt.replace(tzinfo=tz_offset)
+    # Convert to UTC and then to epoch milliseconds
+    dt_utc = dt.astimezone(UTC)
+    # Integer timedelta division: exact, no float round-trip
+    return (dt_utc - EPOCH) // timedelta(milliseconds=1)
+
+
 def date_to_epoch_ms(date_str: str, tz_offset_hours: int = 5, tz_offset_minutes: int = 30) -> int:
     """
     Convert date string to epoch milliseconds.
@@ -42,14 +84,7 @@ def date_to_epoch_ms(date_str: str, tz_offset_hours: int = 5, tz_offset_minutes:
     Default timezone: IST (UTC+5:30)
     """
     try:
-        # Parse the date string
-        dt = datetime.strptime(date_str, "%d-%b-%y %H:%M:%S")
-        # Create timezone offset (IST = UTC+5:30)
-        tz_offset = timezone(timedelta(hours=tz_offset_hours, minutes=tz_offset_minutes))
-        dt = dt.replace(tzinfo=tz_offset)
-        # Convert to UTC and then to epoch milliseconds
-        dt_utc = dt.astimezone(timezone.utc)
-        return int(dt_utc.timestamp() * 1000)
+        return _parse_to_epoch_ms(date_str, tz_offset_hours, tz_offset_minutes)
     except Exception as e:
         raise ValueError(f"Invalid date format: {date_str}. Expected: DD-Mon-YY HH:MM:SS. Error: {e}")
 
@@ -69,91 +104,156 @@ UPDATES: Dict[int, Dict[str, any]] = {
 # ============================================================================
 
 
+def chunks(iterable: Iterable, batch_size: int) -> Iterator[List]:
+    """Yield successive lists of up to batch_size items from iterable."""
+    it = iter(iterable)
+    chunk = list(islice(it, batch_size))
+    while chunk:
+        yield chunk
+        chunk = list(islice(it, batch_size))
+
+
 def main():
     if not UPDATES:
         print("No updates specified. Please edit the UPDATES dictionary in the script.")
         return
     
-    vectors = []
+    unknown_fields = {
+        application_id: sorted(set(field_updates) - ALLOWED_FIELDS)
+        for application_id, field_updates in UPDATES.items()
+        if not ALLOWED_FIELDS.issuperset(field_updates)
+    }
+    if unknown_fields:
+        raise ValueError(f"Unknown metadata fields in UPDATES (application_id: fields): {unknown_fields}. "
+                         f"Allowed: {sorted(ALLOWED_FIELDS)}")
+    
+    ids_by_aid = {application_id: f"placement-{application_id}" for application_id in UPDATES}
+    updates = []  # (vector_id, changed metadata fields) for each record that changes
     not_found = []
+    unchanged = []
+    log_lines = []  # Per-record output, written in one go once every record is prepared
     
+    # Only a deadline change needs the existing record (to rewrite the Deadline line in
+    # its text). Everything else is merged server-side by update(), with no fetch -
+    # which also means those records aren't checked for existence or an 'order' fix.
+    fetch_updates = {}
     for application_id, field_updates in UPDATES.items():
-        vector_id = f"placement-{application_id}"
+        if "application_deadline" in field_updates:
+            fetch_updates[application_id] = field_updates
+        else:
+            vector_id = ids_by_aid[application_id]
+            log_lines.append(f"\nUpdating application_id {application_id} (vector_id: {vector_id}) without fetching:")
+            for field, new_value in field_updates.items():
+                log_lines.append(f"  {field}: → {new_value}")
+            updates.append((vector_id, field_updates))
+    
+    # Fetch the remaining vectors up front, up to FETCH_BATCH_SIZE IDs per request,
+    # with all requests in flight at once
+    vector_ids = [ids_by_aid[application_id] for application_id in fetch_updates]
+    existing_vectors = {}
+    with ThreadPoolExecutor(max_workers=PINECONE_POOL_THREADS) as executor:
+        futures = [
+            (executor.submit(index.fetch, ids=batch, namespace=PINECONE_NAMESPACE), len(batch))
+            for batch in chunks(vector_ids, FETCH_BATCH_SIZE)
+        ]
+        for future, batch_len in futures:
+            try:
+                existing_vectors.update(future.result().vectors)
+            except Exception as e:
+                print(f"⚠️  Error fetching {batch_len} vectors: {e}")
+    
+    for application_id, field_updates in fetch_updates.items():
+        vector_id = ids_by_aid[application_id]
+        
+        # One lookup: anything requested but not returned is missing (or its batch failed)
+        existing_vector = existing_vectors.get(vector_id)
+        if existing_vector is None:
+            not_found.append(application_id)
+            log_lines.append(f"⚠️  Vector ID '{vector_id}' not found in Pinecone")
+            continue
         
-        # Fetch existing vector from Pinecone
         try:
-            fetch_result = index.fetch(ids=[vector_id], namespace=PINECONE_NAMESPACE)
-            if vector_id not in fetch_result.vectors:
-                not_found.append(application_id)
-                print(f"⚠️  Vector ID '{vector_id}' not found in Pinecone")
-                continue
-            
-            existing_vector = fetch_result.vectors[vector_id]
             existing_metadata = existing_vector.metadata or {}
             
-            print(f"\nUpdating application_id {application_id} (vector_id: {vector_id}):")
+            # Only fields whose value actually differs need writing
+            changed = {
+                field: new_value for field, new_value in field_updates.items()
+                if existing_metadata.get(field) != new_value
+            }
             
-            # Update metadata fields
-            updated_metadata = existing_metadata.copy()
-            for field, new_value in field_updates.items():
+            # If updating application_deadline, also update the deadline date in the
+            # text field (format: "Deadline: YYYY-MM-DD")
+            text_from_deadline = False
+            if "application_deadline" in field_updates:
+                new_dt = datetime.fromtimestamp(field_updates["application_deadline"] / 1000)
+                # Fixed layout, so plain integer formatting instead of strftime
+                new_day_str = f"{new_dt.year:04d}-{new_dt.month:02d}-{new_dt.day:02d}"
+                old_text = changed.get("text", existing_metadata.get("text", ""))
+                if old_text and DEADLINE_RE.search(old_text):
+                    updated_text = DEADLINE_RE.sub(f'Deadline: {new_day_str}', old_text)
+                    if updated_text != existing_metadata.get("text"):
+                        changed["text"] = updated_text
+                        text_from_deadline = True
+            
+            # If 'order' field exists in metadata, update it to match application_id
+            if 'order' in existing_metadata and existing_metadata['order'] != application_id:
+                changed['order'] = application_id
+            
+            if not changed:
+                unchanged.append(application_id)
+                continue  # e.g. the script is being re-run
+            
+            log_lines.append(f"\nUpdating application_id {application_id} (vector_id: {vector_id}):")
+            
+            for field, new_value in changed.items():
                 old_value = existing_metadata.get(field, "N/A")
-                updated_metadata[field] = new_value
                 
                 # Show human-readable date conversion for deadlines
                 if field == "application_deadline":
                     old_date_str = datetime.fromtimestamp(old_value / 1000).strftime('%Y-%m-%d %H:%M:%S') if isinstance(old_value, (int, float)) else str(old_value)
-                    new_date_str = datetime.fromtimestamp(new_value / 1000).strftime('%Y-%m-%d %H:%M:%S')
-                    print(f"  {field}: {old_value} ({old_date_str}) → {new_value} ({new_date_str})")
+                    new_date_str = f"{new_day_str} {new_dt.hour:02d}:{new_dt.minute:02d}:{new_dt.second:02d}"
+                    log_lines.append(f"  {field}: {old_value} ({old_date_str}) → {new_value} ({new_date_str})")
+                elif field == "text" and text_from_deadline:
+                    log_lines.append(f"  text (deadline line): Updated to 'Deadline: {new_day_str}'")
                 else:
-                    print(f"  {field}: {old_value} → {new_value}")
-                
-                # If updating application_deadline, also update the text field
-                if field == "application_deadline":
-                    # Update the deadline date in the text field
-                    old_text = existing_metadata.get("text", "")
-                    if old_text:
-                        # Extract old deadline date from text (format: "Deadline: YYYY-MM-DD")
-                        old_deadline_match = re.search(r'Deadline: (\d{4}-\d{2}-\d{2})', old_text)
-                        if old_deadline_match:
-                            # Convert new epoch_ms to date string
-                            new_date = datetime.fromtimestamp(new_value / 1000).date()
-                            new_date_str = new_date.strftime("%Y-%m-%d")
-                            # Replace in text
-                            updated_text = re.sub(
-                                r'Deadline: \d{4}-\d{2}-\d{2}',
-                                f'Deadline: {new_date_str}',
-                                old_text
-                            )
-                            updated_metadata["text"] = updated_text
-                            print(f"  text (deadline line): Updated to 'Deadline: {new_date_str}'")
-            
-            # If 'order' field exists in metadata, update it to match application_id
-            if 'order' in updated_metadata:
-                updated_metadata['order'] = application_id
+                    log_lines.append(f"  {field}: {old_value} → {new_value}")
             
-            # Prepare vector for upsert (keep existing values, update metadata)
-            vectors.append({
-                "id": vector_id,
-                "values": existing_vector.values,  # Keep existing embedding
-                "metadata": updated_metadata,
-            })
+            # Metadata-only update with just the changed keys: update() merges them into
+            # the stored metadata, so neither the embedding nor unchanged fields are re-sent
+            updates.append((vector_id, changed))
             
         except Exception as e:
-            print(f"⚠️  Error fetching vector '{vector_id}': {e}")
+            log_lines.append(f"⚠️  Error updating vector '{vector_id}': {e}")
             not_found.append(application_id)
             continue
     
+    if log_lines:
+        sys.stdout.write("\n".join(log_lines) + "\n")
+    
     if not_found:
         print(f"\n⚠️  Warning: {len(not_found)} vectors not found: {not_found}")
     
-    if vectors:
-        print(f"\n✓ Prepared {len(vectors)} updated records")
-        print(f"Upserting to '{PINECONE_NAMESPACE}' namespace...")
-        index.upsert(vectors=vectors, namespace=PINECONE_NAMESPACE)
-        print(f"✓ Successfully updated {len(vectors)} placement records in Pinecone!")
+    if unchanged:
+        print(f"\n✓ Skipped {len(unchanged)} records that already match: {unchanged}")
+    
+    if updates:
+        print(f"\n✓ Prepared {len(updates)} updated records")
+        print(f"Updating metadata in '{PINECONE_NAMESPACE}' namespace...")
+        updated = 0
+        with ThreadPoolExecutor(max_workers=PINECONE_POOL_THREADS) as executor:
+            futures = [
+                (executor.submit(index.update, id=vector_id, set_metadata=metadata, namespace=PINECONE_NAMESPACE), vector_id)
+                for vector_id, metadata in updates
+            ]
+            for future, vector_id in futures:
+                try:
+                    future.result()
+                    updated += 1
+                except Exception as e:
+                    print(f"⚠️  Update of '{vector_id}' failed: {e}")
+        print(f"✓ Successfully updated {updated} placement records in Pinecone!")
     else:
-        print("No vectors to upsert.")
-
+        print("No records to update.")
 
 if __name__ == "__main__":
     main()